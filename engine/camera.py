@@ -1,27 +1,80 @@
+import functools
 import math
-from dataclasses import dataclass
 
 import numpy as np
-from pyrr import Matrix44, Vector3
 
-from .utils import normalize
+from .utils import look_at, normalize, perspective
 
+FOV_Y_DEGREES = 50.0
+NEAR_PLANE = 0.1
+FAR_PLANE = 280.0
 
-def _exp_smoothing(current: float, target: float, dt: float, speed: float) -> float:
-    blend = 1.0 - math.exp(-speed * max(dt, 1e-6))
-    return current + ((target - current) * blend)
+# Pose layout: [yaw, pitch, distance, target.x, target.y, target.z].
+_POSE_SIZE = 6
+_NEG_SMOOTHING_SPEEDS = -np.array([4.8, 5.2, 5.6, 9.2, 9.2, 9.2], dtype="f4")
 
 
-def _exp_smoothing_vec(current: np.ndarray, target: np.ndarray, dt: float, speed: float) -> np.ndarray:
-    blend = 1.0 - math.exp(-speed * max(dt, 1e-6))
-    return current + ((target - current) * blend)
+def _exp_smoothing_vec(
+    current: np.ndarray,
+    target: np.ndarray,
+    dt: float,
+    neg_speeds: np.ndarray,
+    blend: np.ndarray,
+    scratch: np.ndarray,
+) -> None:
+    """Blend ``current`` toward ``target`` in place with a per-component speed."""
+    np.multiply(neg_speeds, max(dt, 1e-6), out=blend)
+    np.exp(blend, out=blend)
+    np.subtract(1.0, blend, out=blend)
+    np.subtract(target, current, out=scratch)
+    scratch *= blend
+    current += scratch
+
+
+@functools.lru_cache(maxsize=4)
+def _projection(aspect_ratio: float) -> np.ndarray:
+    # Only changes on window resize, so build it once per aspect ratio.
+    matrix = perspective(FOV_Y_DEGREES, aspect_ratio, NEAR_PLANE, FAR_PLANE, np.empty((4, 4), dtype="f4"))
+    matrix.flags.writeable = False
+    return matrix
+
+
+def _sincos_degrees(angle: float) -> tuple[float, float]:
+    radians = math.radians(angle)
+    return math.sin(radians), math.cos(radians)
 
 
-@dataclass
 class CameraState:
-    yaw: float = 180.0
-    pitch: float = 27.5
-    distance: float = 14.0
+    """Yaw/pitch/distance view over a slice of the camera's packed pose array."""
+
+    __slots__ = ("values",)
+
+    def __init__(self, values: np.ndarray) -> None:
+        self.values = values
+
+    @property
+    def yaw(self) -> float:
+        return float(self.values[0])
+
+    @yaw.setter
+    def yaw(self, value: float) -> None:
+        self.values[0] = value
+
+    @property
+    def pitch(self) -> float:
+        return float(self.values[1])
+
+    @pitch.setter
+    def pitch(self, value: float) -> None:
+        self.values[1] = value
+
+    @property
+    def distance(self) -> float:
+        return float(self.values[2])
+
+    @distance.setter
+    def distance(self, value: float) -> None:
+        self.values[2] = value
 
 
 class CinematicCamera:
@@ -33,16 +86,28 @@ class CinematicCamera:
     """
 
     def __init__(self, look_target: tuple[float, float, float]) -> None:
-        self.state = CameraState()
-        self.target_state = CameraState()
-        self.target = np.array(look_target, dtype="f4")
-        self.focus_target = np.array(look_target, dtype="f4")
+        # Current and goal poses are packed so all six channels smooth in one pass.
+        self._pose = np.array([180.0, 27.5, 14.0, *look_target], dtype="f4")
+        self._pose_goal = self._pose.copy()
+        self._pose_blend = np.zeros(_POSE_SIZE, dtype="f4")
+        self._pose_delta = np.zeros(_POSE_SIZE, dtype="f4")
+        self.state = CameraState(self._pose[0:3])
+        self.target_state = CameraState(self._pose_goal[0:3])
+        self.target = self._pose[3:6]
+        self.focus_target = self._pose_goal[3:6]
         self.eye = np.zeros(3, dtype="f4")
         self.prev_eye = np.zeros(3, dtype="f4")
-        # Pre-allocate arrays for performance
-        self._temp_eye = np.zeros(3, dtype="f4")
-        self._temp_right = np.zeros(3, dtype="f4")
-        self._temp_jitter = np.zeros(3, dtype="f4")
+        self._view = np.eye(4, dtype="f4")
+        # Bumped whenever the eye or target moves; view_matrix() and callers caching
+        # camera-derived values (such as the picking inverse) compare against it.
+        self.revision = 0
+        self._view_key = None
+        self._view_revision = -1
+        # Trig of the last yaw/pitch seen; a settled camera skips sin/cos entirely.
+        self._trig_yaw = math.nan
+        self._trig_pitch = math.nan
+        self._sin_yaw = self._cos_yaw = 0.0
+        self._sin_pitch = self._cos_pitch = 0.0
         self.velocity = 0.0
         self.shake = 0.0
         self._noise_phase = 0.0
@@ -52,7 +117,7 @@ class CinematicCamera:
         self.transition_sign = 1.0
 
         self.update(0.016)
-        self.prev_eye[:] = self.eye
+        np.copyto(self.prev_eye, self.eye)
 
     def set_turn_view(self, white_turn: bool) -> None:
         if self.white_side != white_turn:
@@ -66,25 +131,31 @@ class CinematicCamera:
         self.target_state.distance = 15.4
 
     def focus_on(self, point: tuple[float, float, float]) -> None:
-        self.focus_target = np.array(point, dtype="f4")
+        self.focus_target[:] = point
 
     def add_capture_shake(self, amount: float) -> None:
         self.shake = min(1.0, self.shake + amount)
 
     def update(self, dt: float) -> None:
-        self.target = _exp_smoothing_vec(self.target, self.focus_target, dt, speed=9.2)
-        self.state.yaw = _exp_smoothing(self.state.yaw, self.target_state.yaw, dt, speed=4.8)
-        self.state.pitch = _exp_smoothing(self.state.pitch, self.target_state.pitch, dt, speed=5.2)
-        self.state.distance = _exp_smoothing(self.state.distance, self.target_state.distance, dt, speed=5.6)
-
-        yaw_r = math.radians(self.state.yaw)
-        pitch_r = math.radians(self.state.pitch)
-        horizontal = self.state.distance * math.cos(pitch_r)
-        
-        # Reuse pre-allocated array instead of creating new one
-        self._temp_eye[0] = self.target[0] + horizontal * math.sin(yaw_r)
-        self._temp_eye[1] = self.target[1] + self.state.distance * math.sin(pitch_r)
-        self._temp_eye[2] = self.target[2] + horizontal * math.cos(yaw_r)
+        _exp_smoothing_vec(
+            self._pose, self._pose_goal, dt, _NEG_SMOOTHING_SPEEDS, self._pose_blend, self._pose_delta
+        )
+
+        # One tolist() unpacks the whole pose instead of six property/index hops.
+        yaw, pitch, distance, tx, ty, tz = self._pose.tolist()
+        if yaw != self._trig_yaw:
+            self._trig_yaw = yaw
+            self._sin_yaw, self._cos_yaw = _sincos_degrees(yaw)
+        if pitch != self._trig_pitch:
+            self._trig_pitch = pitch
+            self._sin_pitch, self._cos_pitch = _sincos_degrees(pitch)
+        horizontal = distance * self._cos_pitch
+
+        # The eye is a handful of flops, so it stays in Python floats and is
+        # written to the array once; per-element numpy indexing costs more.
+        ex = tx + horizontal * self._sin_yaw
+        ey = ty + distance * self._sin_pitch
+        ez = tz + horizontal * self._cos_yaw
 
         # Turn handoff "drone" motion to make side swap obvious.
         if self.turn_transition > 0.0001:
@@ -93,36 +164,40 @@ class CinematicCamera:
             side_sway = arc * 1.55 * self.transition_sign
             up_lift = arc * 2.1
 
-            self._temp_right[0] = math.cos(yaw_r)
-            self._temp_right[1] = 0.0
-            self._temp_right[2] = -math.sin(yaw_r)
-            self._temp_eye += self._temp_right * side_sway
-            self._temp_eye[1] += up_lift
+            # The right vector reuses the yaw trig already cached for the eye.
+            ex += self._cos_yaw * side_sway
+            ey += up_lift
+            ez -= self._sin_yaw * side_sway
             self.turn_transition = max(0.0, self.turn_transition - (dt * 1.65))
 
         if self.shake > 0.0001:
             self._noise_phase += dt * 30.0
-            self._temp_jitter[0] = math.sin(self._noise_phase * 1.7)
-            self._temp_jitter[1] = math.cos(self._noise_phase * 2.1) * 0.45
-            self._temp_jitter[2] = math.sin(self._noise_phase * 1.3) * 0.65
-            self._temp_eye += self._temp_jitter * (0.06 * self.shake)
+            jitter = 0.06 * self.shake
+            ex += math.sin(self._noise_phase * 1.7) * jitter
+            ey += math.cos(self._noise_phase * 2.1) * 0.45 * jitter
+            ez += math.sin(self._noise_phase * 1.3) * 0.65 * jitter
             self.shake = max(0.0, self.shake - (dt * 2.2))
 
-        # Calculate velocity using single norm calculation
-        self.eye[:] = self._temp_eye
-        delta_norm = np.linalg.norm(self.eye - self.prev_eye)
-        self.velocity = float(delta_norm / max(dt, 1e-5))
-        self.prev_eye[:] = self.eye
+        view_key = (ex, ey, ez, tx, ty, tz)
+        if view_key != self._view_key:
+            self._view_key = view_key
+            self.revision += 1
+
+        px, py, pz = self.prev_eye.tolist()
+        self.eye[:] = (ex, ey, ez)
+        self.velocity = math.hypot(ex - px, ey - py, ez - pz) / max(dt, 1e-5)
+        np.copyto(self.prev_eye, self.eye)
 
     def view_matrix(self) -> np.ndarray:
-        up = Vector3([0.0, 1.0, 0.0])
-        return np.array(Matrix44.look_at(self.eye, self.target, up, dtype="f4"), dtype="f4")
+        """Return the current view matrix. The array is reused by the next call."""
+        if self._view_revision != self.revision:
+            look_at(self.eye, self.target, (0.0, 1.0, 0.0), self._view)
+            self._view_revision = self.revision
+        return self._view
 
     def projection_matrix(self, aspect_ratio: float) -> np.ndarray:
-        return np.array(
-            Matrix44.perspective_projection(50.0, max(aspect_ratio, 0.1), 0.1, 280.0, dtype="f4"),
-            dtype="f4",
-        )
+        """Return the (shared, read-only) projection matrix for ``aspect_ratio``."""
+        return _projection(max(aspect_ratio, 0.1))
 
     def forward(self) -> np.ndarray:
         return normalize(self.target - self.eye)
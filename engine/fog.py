@@ -1,19 +1,36 @@
-from dataclasses import dataclass
-from typing import Tuple
+import weakref
+from dataclasses import dataclass, field
+from typing import Any, Tuple
 
 Vec3 = Tuple[float, float, float]
 
+_FOG_UNIFORMS = ("uFogColor", "uFogDensity", "uFogHeightFalloff")
+
 
 @dataclass
 class FogSettings:
     color: Vec3 = (0.05, 0.07, 0.11)
     density: float = 0.045
     height_falloff: float = 0.18
+    # (color, density, falloff) handles per program, in _FOG_UNIFORMS order; None where a
+    # shader does not declare that fog uniform.
+    _uniforms: Any = field(default_factory=weakref.WeakKeyDictionary, init=False, repr=False, compare=False)
+    # Settings last written to each program; uniforms persist, so unchanged fog skips the writes.
+    _uploaded: Any = field(default_factory=weakref.WeakKeyDictionary, init=False, repr=False, compare=False)
 
     def upload(self, program) -> None:
-        if "uFogColor" in program:
-            program["uFogColor"].value = self.color
-        if "uFogDensity" in program:
-            program["uFogDensity"].value = self.density
-        if "uFogHeightFalloff" in program:
-            program["uFogHeightFalloff"].value = self.height_falloff
+        values = (self.color, self.density, self.height_falloff)
+        if self._uploaded.get(program) == values:
+            return
+        self._uploaded[program] = values
+
+        uniforms = self._uniforms.get(program)
+        if uniforms is None:
+            uniforms = self._uniforms[program] = tuple(program.get(name, None) for name in _FOG_UNIFORMS)
+        color, density, height_falloff = uniforms
+        if color is not None:
+            color.value = self.color
+        if density is not None:
+            density.value = self.density
+        if height_falloff is not None:
+            height_falloff.value = self.height_falloff
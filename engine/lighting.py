@@ -1,8 +1,25 @@
+import weakref
 from dataclasses import dataclass, field
-from typing import List, Sequence, Tuple, Union
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
 
 Vec3 = Tuple[float, float, float]
 
+LIGHT_BLOCK_NAME = "LightBlock"
+LIGHT_BLOCK_BINDING = 0
+# std140 sizes in floats: PointLight is two vec4 rows, SpotLight is three.
+POINT_LIGHT_FLOATS = 8
+SPOT_LIGHT_FLOATS = 12
+_SCALAR_UNIFORMS = (
+    "uAmbient",
+    "uDirLight.direction",
+    "uDirLight.color",
+    "uDirLight.intensity",
+    "uPointLightCount",
+    "uSpotLightCount",
+)
+
 
 @dataclass
 class DirectionalLightDef:
@@ -42,6 +59,12 @@ class SceneLighting:
     directional: DirectionalLightDef = field(default_factory=DirectionalLightDef)
     point_lights: List[PointLightDef] = field(default_factory=list)
     spot_lights: List[SpotLightDef] = field(default_factory=list)
+    _light_ubo: Any = field(default=None, init=False, repr=False, compare=False)
+    _light_data: Optional[np.ndarray] = field(default=None, init=False, repr=False, compare=False)
+    # Light values last uploaded to each program; upload() skips programs that match.
+    _uploaded: Any = field(default_factory=weakref.WeakKeyDictionary, init=False, repr=False, compare=False)
+    # Uniform handles per program, resolved once so uploads skip name lookups.
+    _uniforms: Any = field(default_factory=weakref.WeakKeyDictionary, init=False, repr=False, compare=False)
 
     @staticmethod
     def cyberpunk_defaults(board_height: float) -> "SceneLighting":
@@ -111,39 +134,89 @@ class SceneLighting:
             self.spot_lights[0].direction = (0.0, -1.0, 0.0)
             self.spot_lights[0].intensity = 10.5
 
+    def _upload_key(self, max_point_lights: int, max_spot_lights: int) -> tuple:
+        # Keyed on values, so any direct field assignment is picked up on the next upload.
+        directional = self.directional
+        return (
+            self.ambient_color,
+            directional.direction,
+            directional.color,
+            directional.intensity,
+            tuple((light.position, light.color, light.intensity, light.light_range) for light in self.point_lights),
+            tuple(
+                (light.position, light.direction, light.color, light.intensity, light.cutoff_cos, light.light_range)
+                for light in self.spot_lights
+            ),
+            max_point_lights,
+            max_spot_lights,
+        )
+
     def upload(self, program, max_point_lights: int, max_spot_lights: int) -> None:
-        self._set_uniform(program, "uAmbient", self.ambient_color)
-        self._set_uniform(program, "uDirLight.direction", self.directional.direction)
-        self._set_uniform(program, "uDirLight.color", self.directional.color)
-        self._set_uniform(program, "uDirLight.intensity", self.directional.intensity)
+        upload_key = self._upload_key(max_point_lights, max_spot_lights)
+        if self._uploaded.get(program) == upload_key:
+            # Uniform values persist in the program; only the block binding is global state.
+            if self._light_ubo is not None:
+                self._light_ubo.bind_to_uniform_block(LIGHT_BLOCK_BINDING)
+            return
+        self._uploaded[program] = upload_key
+
+        uniforms = self._uniforms.get(program)
+        if uniforms is None:
+            uniforms = {name: program[name] for name in _SCALAR_UNIFORMS if name in program}
+            uniforms[LIGHT_BLOCK_NAME] = program.get(LIGHT_BLOCK_NAME, None)
+            self._uniforms[program] = uniforms
+
+        self._set_uniform(uniforms, "uAmbient", self.ambient_color)
+        self._set_uniform(uniforms, "uDirLight.direction", self.directional.direction)
+        self._set_uniform(uniforms, "uDirLight.color", self.directional.color)
+        self._set_uniform(uniforms, "uDirLight.intensity", self.directional.intensity)
 
         point_count = min(len(self.point_lights), max_point_lights)
-        self._set_uniform(program, "uPointLightCount", point_count)
-        for i in range(max_point_lights):
-            if i < point_count:
-                light = self.point_lights[i]
-                self._set_uniform(program, f"uPointLights[{i}].position", light.position)
-                self._set_uniform(program, f"uPointLights[{i}].color", light.color)
-                self._set_uniform(program, f"uPointLights[{i}].intensity", light.intensity)
-                self._set_uniform(program, f"uPointLights[{i}].range", light.light_range)
-            else:
-                self._set_uniform(program, f"uPointLights[{i}].intensity", 0.0)
-
         spot_count = min(len(self.spot_lights), max_spot_lights)
-        self._set_uniform(program, "uSpotLightCount", spot_count)
-        for i in range(max_spot_lights):
-            if i < spot_count:
-                light = self.spot_lights[i]
-                self._set_uniform(program, f"uSpotLights[{i}].position", light.position)
-                self._set_uniform(program, f"uSpotLights[{i}].direction", light.direction)
-                self._set_uniform(program, f"uSpotLights[{i}].color", light.color)
-                self._set_uniform(program, f"uSpotLights[{i}].intensity", light.intensity)
-                self._set_uniform(program, f"uSpotLights[{i}].cutoffCos", light.cutoff_cos)
-                self._set_uniform(program, f"uSpotLights[{i}].range", light.light_range)
-            else:
-                self._set_uniform(program, f"uSpotLights[{i}].intensity", 0.0)
+        self._set_uniform(uniforms, "uPointLightCount", point_count)
+        self._set_uniform(uniforms, "uSpotLightCount", spot_count)
+
+        light_block = uniforms[LIGHT_BLOCK_NAME]
+        if light_block is None:
+            return
+        # All point/spot light data goes up in one uniform buffer write.
+        data = self._pack_lights(max_point_lights, max_spot_lights, point_count, spot_count)
+        if self._light_ubo is None or self._light_ubo.size != data.nbytes:
+            self._light_ubo = program.ctx.buffer(reserve=data.nbytes, dynamic=True)
+        self._light_ubo.write(data)
+        light_block.binding = LIGHT_BLOCK_BINDING
+        self._light_ubo.bind_to_uniform_block(LIGHT_BLOCK_BINDING)
+
+    def _pack_lights(
+        self, max_point_lights: int, max_spot_lights: int, point_count: int, spot_count: int
+    ) -> np.ndarray:
+        point_floats = max_point_lights * POINT_LIGHT_FLOATS
+        size = point_floats + (max_spot_lights * SPOT_LIGHT_FLOATS)
+        if self._light_data is None or self._light_data.size != size:
+            self._light_data = np.zeros(size, dtype="f4")
+        data = self._light_data
+        points = data[:point_floats].reshape(max_point_lights, POINT_LIGHT_FLOATS)
+        spots = data[point_floats:].reshape(max_spot_lights, SPOT_LIGHT_FLOATS)
+
+        # Unused slots keep zero intensity.
+        data.fill(0.0)
+        for i in range(point_count):
+            light = self.point_lights[i]
+            points[i] = (*light.position, light.intensity, *light.color, light.light_range)
+        for i in range(spot_count):
+            light = self.spot_lights[i]
+            spots[i] = (
+                *light.position,
+                light.intensity,
+                *light.direction,
+                light.cutoff_cos,
+                *light.color,
+                light.light_range,
+            )
+        return data
 
     @staticmethod
-    def _set_uniform(program, name: str, value: Union[Sequence[float], float, int]) -> None:
-        if name in program:
-            program[name].value = value
+    def _set_uniform(uniforms: Dict[str, Any], name: str, value: Union[Sequence[float], float, int]) -> None:
+        uniform = uniforms.get(name)
+        if uniform is not None:
+            uniform.value = value
@@ -1,8 +1,18 @@
+import functools
+import struct
 from dataclasses import dataclass
-from typing import Tuple
+from typing import Dict, Iterable, List, Tuple
 
 Color3 = Tuple[float, float, float]
 
+MATERIAL_BLOCK_NAME = "MaterialBlock"
+MATERIAL_BLOCK_BINDING = 1
+# Must match the uMaterials array length in pbr.vert.
+MAX_MATERIALS = 32
+# std140 layout of one entry in the shader's material array: vec3s start on 16-byte boundaries.
+_MATERIAL_STRUCT = struct.Struct("<3f3f8x3f4x")
+MATERIAL_STRIDE = _MATERIAL_STRUCT.size
+
 
 @dataclass(frozen=True)
 class MaterialDef:
@@ -12,6 +22,42 @@ class MaterialDef:
     specular: float
     emissive: Color3
 
+    @functools.cached_property
+    def packed(self) -> bytes:
+        """std140 bytes for one material-array entry, built once per instance."""
+        return _MATERIAL_STRUCT.pack(*self.albedo, self.metallic, self.roughness, self.specular, *self.emissive)
+
+
+class MaterialPalette:
+    """Assigns materials slots in the shader's material array; instances carry only the slot."""
+
+    def __init__(self, materials: Iterable[MaterialDef] = ()) -> None:
+        self._slots: Dict[int, int] = {}
+        self._materials: List[MaterialDef] = []
+        # Bumped whenever a material is added, so owners know to re-upload.
+        self.revision = 0
+        for material in materials:
+            self.slot(material)
+
+    def __len__(self) -> int:
+        return len(self._materials)
+
+    def slot(self, material: MaterialDef) -> int:
+        # Keyed by identity: materials are shared constants, and hashing a frozen
+        # dataclass on every lookup costs more than the rest of the instance packing.
+        slot = self._slots.get(id(material))
+        if slot is None:
+            if len(self._materials) >= MAX_MATERIALS:
+                raise ValueError(f"material palette is full ({MAX_MATERIALS} entries)")
+            slot = self._slots[id(material)] = len(self._materials)
+            # Holding the material keeps its id() from being reused.
+            self._materials.append(material)
+            self.revision += 1
+        return slot
+
+    def packed(self) -> bytes:
+        return b"".join(material.packed for material in self._materials)
+
 
 class CyberpunkMaterials:
     BOARD_FRAME = MaterialDef((0.07, 0.1, 0.17), 0.5, 0.48, 0.8, (0.0, 0.0, 0.0))
@@ -1,138 +1,228 @@
+import re
+import weakref
 from pathlib import Path
 
-import numpy as np
-
 from .utils import read_shader
 
 
-# Module-level constant for quad geometry to avoid repeated allocations
-_QUAD_VERTICES = np.array(
-    [
-        -1.0,
-        -1.0,
-        0.0,
-        0.0,
-        1.0,
-        -1.0,
-        1.0,
-        0.0,
-        1.0,
-        1.0,
-        1.0,
-        1.0,
-        -1.0,
-        -1.0,
-        0.0,
-        0.0,
-        1.0,
-        1.0,
-        1.0,
-        1.0,
-        -1.0,
-        1.0,
-        0.0,
-        1.0,
-    ],
-    dtype="f4",
+_GL_R11F_G11F_B10F = 0x8C3A
+_GL_FRAMEBUFFER_SRGB = 0x8DB9
+# Bloom mip levels below the half-res bright pass. Each level halves the size, so
+# the glow spreads over the same fraction of the screen at any resolution.
+_BLOOM_LEVELS = 3
+# Below this composite strength the glow is invisible, so the bloom chain is skipped.
+_MIN_BLOOM_STRENGTH = 1e-4
+
+# Last value written to each composite uniform, per (possibly shared) program.
+_COMPOSITE_VALUES = weakref.WeakKeyDictionary()
+# Last uTexel written to each bloom program, which is likewise shared between pipelines.
+_TEXEL_VALUES = weakref.WeakKeyDictionary()
+_COMPOSITE_UNIFORMS = (
+    "uScene",
+    "uBloom",
+    "uDepth",
+    "uExposure",
+    "uBloomStrength",
+    "uTime",
+    "uCameraSpeed",
+    "uFocusDepth",
+    "uDofStrength",
+    "uMotionBlur",
+    "uResolution",
+    "uTexel",
 )
 
 
+def _cached_program(ctx, vertex_shader: str, fragment_shader: str):
+    """Compile each source pair once per context; further pipelines reuse the program."""
+    # Stored on the context so the programs live exactly as long as it does.
+    if ctx.extra is None:
+        ctx.extra = {}
+    programs = ctx.extra.setdefault("post_programs", {})
+    key = (vertex_shader, fragment_shader)
+    program = programs.get(key)
+    if program is None:
+        program = programs[key] = ctx.program(vertex_shader=vertex_shader, fragment_shader=fragment_shader)
+    return program
+
+
+def _specialize(source: str, name: str, value: int) -> str:
+    """Rewrite a shader's ``#define NAME <int>`` line to compile a specialized variant."""
+    return re.sub(rf"^#define {name} \d+$", f"#define {name} {value}", source, count=1, flags=re.MULTILINE)
+
+
 class PostProcessingPipeline:
-    def __init__(self, ctx, shader_dir: Path, width: int, height: int) -> None:
+    def __init__(self, ctx, shader_dir: Path, width: int, height: int, srgb_output: bool = False) -> None:
         self.ctx = ctx
+        # Only enable srgb_output when the default framebuffer is known to be sRGB-capable;
+        # moderngl cannot query its encoding, and a linear framebuffer would come out dark.
+        self.srgb_output = srgb_output
         self.shader_dir = shader_dir
         self.width = width
         self.height = height
 
-        self.blur_program = self.ctx.program(
-            vertex_shader=read_shader(shader_dir / "post_quad.vert"),
-            fragment_shader=read_shader(shader_dir / "bloom_blur.frag"),
+        quad_source = read_shader(shader_dir / "post_quad.vert")
+        self.downsample_program = _cached_program(
+            self.ctx, quad_source, read_shader(shader_dir / "bloom_downsample.frag")
         )
-        self.composite_program = self.ctx.program(
-            vertex_shader=read_shader(shader_dir / "post_quad.vert"),
-            fragment_shader=read_shader(shader_dir / "final_composite.frag"),
+        self.dual_down_program = _cached_program(
+            self.ctx, quad_source, read_shader(shader_dir / "bloom_dual_down.frag")
         )
-
-        # Use pre-allocated module-level constant
-        self.quad_vbo = self.ctx.buffer(_QUAD_VERTICES.tobytes())
-        self.blur_vao = self.ctx.vertex_array(
-            self.blur_program,
-            [(self.quad_vbo, "2f 2f", "in_position", "in_uv")],
-        )
-        self.composite_vao = self.ctx.vertex_array(
-            self.composite_program,
-            [(self.quad_vbo, "2f 2f", "in_position", "in_uv")],
+        self.dual_up_program = _cached_program(self.ctx, quad_source, read_shader(shader_dir / "bloom_dual_up.frag"))
+        composite_source = _specialize(
+            read_shader(shader_dir / "final_composite.frag"), "SRGB_OUTPUT", int(srgb_output)
         )
+        self.composite_program = _cached_program(self.ctx, quad_source, composite_source)
+
+        # post_quad.vert builds a fullscreen triangle from gl_VertexID, so the
+        # VAOs carry no vertex buffers.
+        self.downsample_vao = self.ctx.vertex_array(self.downsample_program, [])
+        self.dual_down_vao = self.ctx.vertex_array(self.dual_down_program, [])
+        self.dual_up_vao = self.ctx.vertex_array(self.dual_up_program, [])
+        self.composite_vao = self.ctx.vertex_array(self.composite_program, [])
+
+        # Samplers never change unit; bind them once.
+        for program in (self.downsample_program, self.dual_down_program, self.dual_up_program):
+            program["uImage"].value = 0
+        self._texel_uniforms = {
+            program: program["uTexel"]
+            for program in (self.downsample_program, self.dual_down_program, self.dual_up_program)
+        }
+        self._composite_uniforms = {
+            name: self.composite_program.get(name, None) for name in _COMPOSITE_UNIFORMS
+        }
+        # Keyed by program: a shared program's uniforms are shared by every pipeline.
+        self._composite_values = _COMPOSITE_VALUES.setdefault(self.composite_program, {})
+        self._set_composite_uniform("uScene", 0)
+        self._set_composite_uniform("uBloom", 1)
+        self._set_composite_uniform("uDepth", 2)
 
         self.scene_fbo = None
         self.scene_color = None
-        self.scene_bright = None
         self.scene_depth = None
-        self.pingpong_fbo = []
-        self.pingpong_textures = []
+        self.bloom_fbos = []
+        self.bloom_textures = []
+        self._bloom_passes = []
         self.bloom_texture = None
+        # Stands in for the bloom chain when it is skipped; never resized.
+        self.black_texture = self.ctx.texture((1, 1), 3, bytes(3))
+        self._depth_test = None
         self._rebuild_targets()
 
-    def _make_color_tex(self):
-        tex = self.ctx.texture((self.width, self.height), 4, dtype="f2")
+    def _make_color_tex(self, size, packed_rgb: bool = False):
+        if packed_rgb:
+            # 4 bytes per texel instead of 8; fine for alpha-less HDR bloom.
+            tex = self.ctx.texture(size, 3, dtype="f2", internal_format=_GL_R11F_G11F_B10F)
+        else:
+            tex = self.ctx.texture(size, 4, dtype="f2")
         tex.filter = (self.ctx.LINEAR, self.ctx.LINEAR)
         tex.repeat_x = False
         tex.repeat_y = False
         return tex
 
+    def _release_targets(self) -> None:
+        # Drivers keep VRAM until release(); a window drag would otherwise pile up targets.
+        for resource in (*self.bloom_fbos, *self.bloom_textures, self.scene_fbo, self.scene_color, self.scene_depth):
+            if resource is not None:
+                resource.release()
+        self.bloom_fbos = []
+        self.bloom_textures = []
+
     def _rebuild_targets(self) -> None:
-        self.scene_color = self._make_color_tex()
-        self.scene_bright = self._make_color_tex()
+        self._release_targets()
+        size = (self.width, self.height)
+        self.scene_color = self._make_color_tex(size)
         self.scene_depth = self.ctx.depth_texture((self.width, self.height))
         self.scene_depth.repeat_x = False
         self.scene_depth.repeat_y = False
 
         self.scene_fbo = self.ctx.framebuffer(
-            color_attachments=[self.scene_color, self.scene_bright],
+            color_attachments=[self.scene_color],
             depth_attachment=self.scene_depth,
         )
 
-        self.pingpong_textures = [self._make_color_tex(), self._make_color_tex()]
-        self.pingpong_fbo = [
-            self.ctx.framebuffer(color_attachments=[self.pingpong_textures[0]]),
-            self.ctx.framebuffer(color_attachments=[self.pingpong_textures[1]]),
+        # Bloom mip chain: half resolution first, then each level halves again.
+        bloom_width, bloom_height = self.width, self.height
+        for _ in range(_BLOOM_LEVELS + 1):
+            bloom_width, bloom_height = max(1, bloom_width // 2), max(1, bloom_height // 2)
+            texture = self._make_color_tex((bloom_width, bloom_height), packed_rgb=True)
+            self.bloom_textures.append(texture)
+            self.bloom_fbos.append(self.ctx.framebuffer(color_attachments=[texture]))
+        self.bloom_texture = self.bloom_textures[0]
+
+        # Every pass's source, target and texel size is fixed until the next resize.
+        # Bright-pass extraction and the half-res downsample happen in one pass; dual
+        # filtering then walks down the mip chain and back up. Each up pass overwrites
+        # a level whose downsampled content is no longer needed.
+        textures, fbos = self.bloom_textures, self.bloom_fbos
+        passes = [(self.downsample_vao, self.downsample_program, self.scene_color, fbos[0])]
+        passes += [
+            (self.dual_down_vao, self.dual_down_program, textures[level - 1], fbos[level])
+            for level in range(1, len(textures))
         ]
-        self.bloom_texture = self.pingpong_textures[0]
+        passes += [
+            (self.dual_up_vao, self.dual_up_program, textures[level + 1], fbos[level])
+            for level in range(len(textures) - 2, -1, -1)
+        ]
+        self._bloom_passes = [
+            (vao, program, source, target, (1.0 / source.size[0], 1.0 / source.size[1]))
+            for vao, program, source, target in passes
+        ]
+
+    def _set_composite_uniform(self, name: str, value) -> None:
+        # Skip the GL call when the value matches what the program already holds.
+        if self._composite_values.get(name) == value:
+            return
+        self._composite_values[name] = value
+        uniform = self._composite_uniforms[name]
+        if uniform is not None:
+            uniform.value = value
 
     def resize(self, width: int, height: int) -> None:
         self.width = max(1, width)
         self.height = max(1, height)
         self._rebuild_targets()
 
+    def _set_depth_test(self, enabled: bool) -> None:
+        # Tracks only this pipeline's own toggles; begin_scene resyncs it every frame.
+        if self._depth_test is enabled:
+            return
+        self._depth_test = enabled
+        if enabled:
+            self.ctx.enable(self.ctx.DEPTH_TEST)
+        else:
+            self.ctx.disable(self.ctx.DEPTH_TEST)
+
     def begin_scene(self) -> None:
+        # use() also sets the viewport to the framebuffer's full size.
         self.scene_fbo.use()
-        self.ctx.viewport = (0, 0, self.width, self.height)
         self.ctx.enable(self.ctx.DEPTH_TEST)
+        self._depth_test = True
         self.ctx.clear(0.01, 0.015, 0.03, 1.0, depth=1.0)
 
-    def apply_bloom(self, blur_passes: int = 8) -> None:
-        self.ctx.disable(self.ctx.DEPTH_TEST)
-        horizontal = True
-        first = True
-        self.blur_program["uImage"].value = 0
-
-        for _ in range(blur_passes):
-            target_index = 0 if horizontal else 1
-            self.pingpong_fbo[target_index].use()
-            self.ctx.clear(0.0, 0.0, 0.0, 1.0)
-            self.blur_program["uHorizontal"].value = horizontal
-            if first:
-                self.scene_bright.use(location=0)
-                first = False
-            else:
-                source_index = 1 if horizontal else 0
-                self.pingpong_textures[source_index].use(location=0)
-            self.blur_vao.render(self.ctx.TRIANGLES)
-            horizontal = not horizontal
-
-        last_index = 1 if horizontal else 0
-        self.bloom_texture = self.pingpong_textures[last_index]
-        self.ctx.enable(self.ctx.DEPTH_TEST)
+    def _filter_pass(self, vao, program, source, target, texel) -> None:
+        target.use()
+        source.use(location=0)
+        # Texel size comes from the CPU instead of textureSize() in every fragment.
+        # A dual-filter program serves several levels, so it is only rewritten when
+        # the level size differs from the one it already holds.
+        if _TEXEL_VALUES.get(program) != texel:
+            _TEXEL_VALUES[program] = texel
+            self._texel_uniforms[program].value = texel
+        vao.render(self.ctx.TRIANGLES, vertices=3)
+
+    def apply_bloom(self, strength: float = 1.0) -> None:
+        if strength < _MIN_BLOOM_STRENGTH:
+            self.bloom_texture = self.black_texture
+            return
+
+        # Depth testing stays off until composite() finishes.
+        self._set_depth_test(False)
+
+        for bloom_pass in self._bloom_passes:
+            self._filter_pass(*bloom_pass)
+
+        self.bloom_texture = self.bloom_textures[0]
 
     def composite(
         self,
@@ -145,25 +235,29 @@ class PostProcessingPipeline:
         motion_blur: float,
     ) -> None:
         self.ctx.screen.use()
+        # The default framebuffer's viewport is not updated on resize, so set it here.
         self.ctx.viewport = (0, 0, self.width, self.height)
-        self.ctx.disable(self.ctx.DEPTH_TEST)
-        self.ctx.clear(0.0, 0.0, 0.0, 1.0)
+        self._set_depth_test(False)
 
         self.scene_color.use(location=0)
         self.bloom_texture.use(location=1)
         self.scene_depth.use(location=2)
 
-        self.composite_program["uScene"].value = 0
-        self.composite_program["uBloom"].value = 1
-        self.composite_program["uDepth"].value = 2
-        self.composite_program["uExposure"].value = exposure
-        self.composite_program["uBloomStrength"].value = bloom_strength
-        self.composite_program["uTime"].value = elapsed_time
-        self.composite_program["uCameraSpeed"].value = camera_speed
-        self.composite_program["uFocusDepth"].value = focus_depth
-        self.composite_program["uDofStrength"].value = dof_strength
-        self.composite_program["uMotionBlur"].value = motion_blur
-        self.composite_program["uResolution"].value = (float(self.width), float(self.height))
-
-        self.composite_vao.render(self.ctx.TRIANGLES)
-        self.ctx.enable(self.ctx.DEPTH_TEST)
+        self._set_composite_uniform("uExposure", exposure)
+        self._set_composite_uniform("uBloomStrength", bloom_strength)
+        self._set_composite_uniform("uTime", elapsed_time)
+        self._set_composite_uniform("uCameraSpeed", camera_speed)
+        self._set_composite_uniform("uFocusDepth", focus_depth)
+        self._set_composite_uniform("uDofStrength", dof_strength)
+        self._set_composite_uniform("uMotionBlur", motion_blur)
+        self._set_composite_uniform("uResolution", (float(self.width), float(self.height)))
+        self._set_composite_uniform("uTexel", (1.0 / self.width, 1.0 / self.height))
+
+        if self.srgb_output:
+            # The hardware applies the sRGB curve on write instead of pow() in the shader.
+            self.ctx.enable_direct(_GL_FRAMEBUFFER_SRGB)
+            self.composite_vao.render(self.ctx.TRIANGLES, vertices=3)
+            self.ctx.disable_direct(_GL_FRAMEBUFFER_SRGB)
+        else:
+            self.composite_vao.render(self.ctx.TRIANGLES, vertices=3)
+        self._set_depth_test(True)
@@ -2,24 +2,32 @@ from __future__ import annotations
 
 import math
 import random
-from dataclasses import dataclass
+import struct
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple, Union
 
 import chess
 import moderngl
 import numpy as np
 from game_core import ChessGameState
-from pyrr import Matrix44, Vector3
 
 from .camera import CinematicCamera
 from .fog import FogSettings
 from .lighting import SceneLighting
-from .materials import CyberpunkMaterials, MaterialDef
+from .materials import (
+    MATERIAL_BLOCK_BINDING,
+    MATERIAL_BLOCK_NAME,
+    MATERIAL_STRIDE,
+    MAX_MATERIALS,
+    CyberpunkMaterials,
+    MaterialDef,
+    MaterialPalette,
+)
 from .post_processing import PostProcessingPipeline
 from .shadows import ShadowMapper
 from .skybox import SkyboxPass
-from .utils import normalize, read_shader
+from .utils import boxes_in_frustum, clamp, frustum_planes, read_shader
 
 MAX_POINT_LIGHTS = 8
 MAX_SPOT_LIGHTS = 2
@@ -29,258 +37,61 @@ KEY_R = 82
 MOUSE_LEFT = 0
 ACTION_PRESS = 1
 
-# Module-level constants for geometry to avoid repeated allocations
-_CUBE_VERTICES = np.array(
+# Cube faces as (normal, u axis, v axis); each face is a quad spanned by its axes.
+_CUBE_FACES = np.array(
     [
-        # +Z
-        -0.5,
-        -0.5,
-        0.5,
-        0.0,
-        0.0,
-        1.0,
-        0.0,
-        0.0,
-        0.5,
-        -0.5,
-        0.5,
-        0.0,
-        0.0,
-        1.0,
-        1.0,
-        0.0,
-        0.5,
-        0.5,
-        0.5,
-        0.0,
-        0.0,
-        1.0,
-        1.0,
-        1.0,
-        -0.5,
-        0.5,
-        0.5,
-        0.0,
-        0.0,
-        1.0,
-        0.0,
-        1.0,
-        # -Z
-        0.5,
-        -0.5,
-        -0.5,
-        0.0,
-        0.0,
-        -1.0,
-        0.0,
-        0.0,
-        -0.5,
-        -0.5,
-        -0.5,
-        0.0,
-        0.0,
-        -1.0,
-        1.0,
-        0.0,
-        -0.5,
-        0.5,
-        -0.5,
-        0.0,
-        0.0,
-        -1.0,
-        1.0,
-        1.0,
-        0.5,
-        0.5,
-        -0.5,
-        0.0,
-        0.0,
-        -1.0,
-        0.0,
-        1.0,
-        # +X
-        0.5,
-        -0.5,
-        0.5,
-        1.0,
-        0.0,
-        0.0,
-        0.0,
-        0.0,
-        0.5,
-        -0.5,
-        -0.5,
-        1.0,
-        0.0,
-        0.0,
-        1.0,
-        0.0,
-        0.5,
-        0.5,
-        -0.5,
-        1.0,
-        0.0,
-        0.0,
-        1.0,
-        1.0,
-        0.5,
-        0.5,
-        0.5,
-        1.0,
-        0.0,
-        0.0,
-        0.0,
-        1.0,
-        # -X
-        -0.5,
-        -0.5,
-        -0.5,
-        -1.0,
-        0.0,
-        0.0,
-        0.0,
-        0.0,
-        -0.5,
-        -0.5,
-        0.5,
-        -1.0,
-        0.0,
-        0.0,
-        1.0,
-        0.0,
-        -0.5,
-        0.5,
-        0.5,
-        -1.0,
-        0.0,
-        0.0,
-        1.0,
-        1.0,
-        -0.5,
-        0.5,
-        -0.5,
-        -1.0,
-        0.0,
-        0.0,
-        0.0,
-        1.0,
-        # +Y
-        -0.5,
-        0.5,
-        0.5,
-        0.0,
-        1.0,
-        0.0,
-        0.0,
-        0.0,
-        0.5,
-        0.5,
-        0.5,
-        0.0,
-        1.0,
-        0.0,
-        1.0,
-        0.0,
-        0.5,
-        0.5,
-        -0.5,
-        0.0,
-        1.0,
-        0.0,
-        1.0,
-        1.0,
-        -0.5,
-        0.5,
-        -0.5,
-        0.0,
-        1.0,
-        0.0,
-        0.0,
-        1.0,
-        # -Y
-        -0.5,
-        -0.5,
-        -0.5,
-        0.0,
-        -1.0,
-        0.0,
-        0.0,
-        0.0,
-        0.5,
-        -0.5,
-        -0.5,
-        0.0,
-        -1.0,
-        0.0,
-        1.0,
-        0.0,
-        0.5,
-        -0.5,
-        0.5,
-        0.0,
-        -1.0,
-        0.0,
-        1.0,
-        1.0,
-        -0.5,
-        -0.5,
-        0.5,
-        0.0,
-        -1.0,
-        0.0,
-        0.0,
-        1.0,
+        ((0, 0, 1), (1, 0, 0), (0, 1, 0)),  # +Z
+        ((0, 0, -1), (-1, 0, 0), (0, 1, 0)),  # -Z
+        ((1, 0, 0), (0, 0, -1), (0, 1, 0)),  # +X
+        ((-1, 0, 0), (0, 0, 1), (0, 1, 0)),  # -X
+        ((0, 1, 0), (1, 0, 0), (0, 0, -1)),  # +Y
+        ((0, -1, 0), (1, 0, 0), (0, 0, 1)),  # -Y
     ],
     dtype="f4",
 )
+_QUAD_UVS = np.array([(0, 0), (1, 0), (1, 1), (0, 1)], dtype="f4")
+
+
+def _cube_geometry() -> Tuple[np.ndarray, np.ndarray]:
+    """Build the unit cube as interleaved position/normal/uv rows and triangle indices."""
+    normals, u_axes, v_axes = (_CUBE_FACES[:, None, k] for k in range(3))
+    offsets = _QUAD_UVS[None] - 0.5
+    positions = 0.5 * normals + offsets[..., :1] * u_axes + offsets[..., 1:] * v_axes
+    vertices = np.concatenate(
+        (positions, np.broadcast_to(normals, positions.shape), np.broadcast_to(_QUAD_UVS, (6, 4, 2))), axis=2
+    )
+    indices = (np.arange(6)[:, None] * 4 + np.array([0, 1, 2, 0, 2, 3])).astype("i4")
+    return vertices.ravel(), indices.ravel()
+
+
+# Module-level constants for geometry to avoid repeated allocations
+_CUBE_VERTICES, _CUBE_INDICES = _cube_geometry()
 
-_CUBE_INDICES = np.array(
-    [
-        0,
-        1,
-        2,
-        0,
-        2,
-        3,
-        4,
-        5,
-        6,
-        4,
-        6,
-        7,
-        8,
-        9,
-        10,
-        8,
-        10,
-        11,
-        12,
-        13,
-        14,
-        12,
-        14,
-        15,
-        16,
-        17,
-        18,
-        16,
-        18,
-        19,
-        20,
-        21,
-        22,
-        20,
-        22,
-        23,
-    ],
-    dtype="i4",
-)
+
+# Per-instance record: the model matrix, a material palette slot and an emissive
+# multiplier for pulsing neon.
+INSTANCE_DTYPE = np.dtype([("model", "f4", (4, 4)), ("material", "i4"), ("emissive_scale", "f4")])
+_INSTANCE_STRIDE = INSTANCE_DTYPE.itemsize
+_INSTANCE_TAIL = struct.Struct("<if")
+_INSTANCE_FORMAT = "16f i f/i"
+_INSTANCE_ATTRIBUTES = ("in_model", "in_material", "in_emissive_scale")
+_SHADOW_INSTANCE_FORMAT = f"16f {_INSTANCE_TAIL.size}x/i"
+
+RAIN_DROP_COUNT = 320
+RAIN_WIDTH = 0.014
 
 
 @dataclass
 class MeshBundle:
-    vao_scene: moderngl.VertexArray
-    vao_shadow: moderngl.VertexArray
+    vbo: moderngl.Buffer
+    ibo: moderngl.Buffer
+    vao_scene: Optional[moderngl.VertexArray] = None
+    vao_shadow: Optional[moderngl.VertexArray] = None
+    instance_vbo: Optional[moderngl.Buffer] = None
+    instance_capacity: int = 0
+    # Shadow casters are written first, so the shadow pass draws a prefix of the buffer.
+    instance_count: int = 0
+    shadow_count: int = 0
 
 
 @dataclass
@@ -292,17 +103,12 @@ class RenderObject:
     pulse_speed: float = 0.0
     pulse_phase: float = 0.0
     pulse_strength: float = 0.0
+    # Serialized once: models are fixed after construction, and every frame's
+    # instance upload reuses these bytes.
+    model_bytes: bytes = field(init=False, repr=False, compare=False)
 
-
-@dataclass
-class RainDrop:
-    x: float
-    y: float
-    z: float
-    speed: float
-    drift: float
-    length: float
-    render_obj: RenderObject
+    def __post_init__(self) -> None:
+        self.model_bytes = self.model.tobytes()
 
 
 @dataclass(frozen=True)
@@ -313,104 +119,221 @@ class PiecePart:
     yaw_degrees: float = 0.0
 
 
+# Every piece stands on the same two-tier base.
+_BASE_PARTS: Tuple[PiecePart, ...] = (
+    PiecePart("cylinder", (0.0, 0.05, 0.0), (0.58, 0.08, 0.58)),
+    PiecePart("cylinder", (0.0, 0.11, 0.0), (0.44, 0.04, 0.44)),
+)
+
+# Built once at import; parts are immutable, so every renderer shares these tuples.
+_PIECE_PARTS: Dict[int, Tuple[PiecePart, ...]] = {
+    chess.PAWN: (
+        *_BASE_PARTS,
+        PiecePart("cylinder", (0.0, 0.23, 0.0), (0.24, 0.20, 0.24)),
+        PiecePart("cylinder", (0.0, 0.36, 0.0), (0.16, 0.10, 0.16)),
+        PiecePart("cone", (0.0, 0.50, 0.0), (0.15, 0.14, 0.15)),
+    ),
+    chess.ROOK: (
+        *_BASE_PARTS,
+        PiecePart("cylinder", (0.0, 0.28, 0.0), (0.34, 0.30, 0.34)),
+        PiecePart("cylinder", (0.0, 0.50, 0.0), (0.44, 0.10, 0.44)),
+        PiecePart("cube", (-0.20, 0.62, -0.20), (0.10, 0.10, 0.10)),
+        PiecePart("cube", (-0.20, 0.62, 0.20), (0.10, 0.10, 0.10)),
+        PiecePart("cube", (0.20, 0.62, -0.20), (0.10, 0.10, 0.10)),
+        PiecePart("cube", (0.20, 0.62, 0.20), (0.10, 0.10, 0.10)),
+    ),
+    chess.KNIGHT: (
+        *_BASE_PARTS,
+        PiecePart("cylinder", (0.0, 0.24, 0.0), (0.30, 0.18, 0.30)),
+        PiecePart("cube", (0.0, 0.42, -0.03), (0.22, 0.24, 0.30)),
+        PiecePart("cube", (0.0, 0.62, 0.08), (0.14, 0.30, 0.18)),
+        PiecePart("cube", (0.0, 0.80, 0.15), (0.10, 0.10, 0.14)),
+        PiecePart("cube", (0.06, 0.88, 0.13), (0.03, 0.10, 0.03)),
+        PiecePart("cube", (-0.06, 0.88, 0.13), (0.03, 0.10, 0.03)),
+        PiecePart("cube", (0.0, 0.68, -0.12), (0.04, 0.22, 0.08)),
+    ),
+    chess.BISHOP: (
+        *_BASE_PARTS,
+        PiecePart("cylinder", (0.0, 0.24, 0.0), (0.28, 0.20, 0.28)),
+        PiecePart("cylinder", (0.0, 0.45, 0.0), (0.20, 0.26, 0.20)),
+        PiecePart("cone", (0.0, 0.68, 0.0), (0.14, 0.24, 0.14)),
+        PiecePart("cylinder", (0.0, 0.83, 0.0), (0.08, 0.08, 0.08)),
+        PiecePart("cube", (0.0, 0.72, 0.12), (0.02, 0.20, 0.04)),
+    ),
+    chess.QUEEN: (
+        *_BASE_PARTS,
+        PiecePart("cylinder", (0.0, 0.27, 0.0), (0.30, 0.24, 0.30)),
+        PiecePart("cylinder", (0.0, 0.48, 0.0), (0.22, 0.18, 0.22)),
+        PiecePart("cylinder", (0.0, 0.62, 0.0), (0.34, 0.07, 0.34)),
+        PiecePart("cylinder", (0.0, 0.75, 0.0), (0.12, 0.10, 0.12)),
+        PiecePart("cone", (-0.16, 0.82, 0.0), (0.05, 0.12, 0.05)),
+        PiecePart("cone", (0.16, 0.82, 0.0), (0.05, 0.12, 0.05)),
+        PiecePart("cone", (0.0, 0.82, -0.16), (0.05, 0.12, 0.05)),
+        PiecePart("cone", (0.0, 0.82, 0.16), (0.05, 0.12, 0.05)),
+        PiecePart("cone", (0.0, 0.88, 0.0), (0.06, 0.10, 0.06)),
+    ),
+    chess.KING: (
+        *_BASE_PARTS,
+        PiecePart("cylinder", (0.0, 0.28, 0.0), (0.30, 0.24, 0.30)),
+        PiecePart("cylinder", (0.0, 0.50, 0.0), (0.22, 0.22, 0.22)),
+        PiecePart("cylinder", (0.0, 0.70, 0.0), (0.12, 0.12, 0.12)),
+        PiecePart("cylinder", (0.0, 0.84, 0.0), (0.04, 0.22, 0.04)),
+        PiecePart("cube", (0.0, 0.91, 0.0), (0.22, 0.04, 0.04)),
+        PiecePart("cube", (0.0, 0.96, 0.0), (0.04, 0.14, 0.04)),
+    ),
+}
+
+# The same layouts as columns, so a piece's part models come from one batched build.
+_PIECE_PART_COLUMNS: Dict[int, Tuple[np.ndarray, np.ndarray, np.ndarray]] = {
+    piece_type: (
+        np.array([part.offset for part in parts]),
+        np.array([part.scale for part in parts]),
+        np.array([part.yaw_degrees for part in parts]),
+    )
+    for piece_type, parts in _PIECE_PARTS.items()
+}
+
 
 def _model_matrix(
     position: Tuple[float, float, float],
     scale: Tuple[float, float, float] = (1.0, 1.0, 1.0),
     yaw_degrees: float = 0.0,
 ) -> np.ndarray:
-    translation = Matrix44.from_translation(Vector3(position), dtype="f4")
-    rotation = Matrix44.from_y_rotation(math.radians(yaw_degrees), dtype="f4")
-    scale_m = Matrix44.from_scale(Vector3(scale), dtype="f4")
-    return np.array(translation * rotation * scale_m, dtype="f4")
-
-
-def _cube_geometry() -> Tuple[np.ndarray, np.ndarray]:
-    # Return pre-allocated module-level constants to avoid repeated allocations
-    return _CUBE_VERTICES, _CUBE_INDICES
+    """Build translate * yaw * scale in pyrr's row-vector layout without pyrr temporaries."""
+    sx, sy, sz = scale
+    if yaw_degrees:
+        radians = math.radians(yaw_degrees)
+        c, s = math.cos(radians), math.sin(radians)
+    else:
+        c, s = 1.0, 0.0
+    return np.array(
+        (
+            (c * sx, 0.0, s * sx, 0.0),
+            (0.0, sy, 0.0, 0.0),
+            (-s * sz, 0.0, c * sz, 0.0),
+            (position[0], position[1], position[2], 1.0),
+        ),
+        dtype="f4",
+    )
+
+
+def _model_matrices(positions: np.ndarray, scales: np.ndarray, yaw_degrees: np.ndarray) -> np.ndarray:
+    """Batched _model_matrix: (N, 3) positions and scales and (N,) yaws to (N, 4, 4) float32."""
+    radians = np.radians(yaw_degrees)
+    c, s = np.cos(radians), np.sin(radians)
+    sx, sy, sz = np.asarray(scales).T
+    models = np.zeros((len(radians), 4, 4), dtype="f4")
+    models[:, 0, 0] = c * sx
+    models[:, 0, 2] = s * sx
+    models[:, 1, 1] = sy
+    models[:, 2, 0] = -s * sz
+    models[:, 2, 2] = c * sz
+    models[:, 3, :3] = positions
+    models[:, 3, 3] = 1.0
+    return models
+
+
+def _ring(segments: int, count: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Return x and z of ``count`` points stepping around a radius-0.5 circle."""
+    t = (np.arange(count) / segments) * math.tau
+    return np.cos(t) * 0.5, np.sin(t) * 0.5
+
+
+def _disc_cap(segments: int, y: float, first_index: int, facing_up: bool) -> Tuple[np.ndarray, np.ndarray]:
+    """Return a flat cap at height ``y``: a center vertex and a ring, fanned into triangles."""
+    x, z = _ring(segments, segments)
+    normal_y = 1.0 if facing_up else -1.0
+    vertices = np.zeros((segments + 1, 8))
+    vertices[0] = (0.0, y, 0.0, 0.0, normal_y, 0.0, 0.5, 0.5)
+    vertices[1:, 0] = x
+    vertices[1:, 1] = y
+    vertices[1:, 2] = z
+    vertices[1:, 4] = normal_y
+    vertices[1:, 6] = x + 0.5
+    vertices[1:, 7] = z + 0.5
+
+    ring = first_index + 1 + np.arange(segments)
+    a, b = ring, np.roll(ring, -1)
+    center = np.full(segments, first_index)
+    # Winding flips with the facing so both caps stay front-facing from outside.
+    indices = np.column_stack((center, a, b) if facing_up else (center, b, a))
+    return vertices, indices.ravel()
 
 
 def _cylinder_geometry(segments: int = 20) -> Tuple[np.ndarray, np.ndarray]:
-    vertices: List[float] = []
-    indices: List[int] = []
-
-    # Side surface
-    for i in range(segments + 1):
-        t = (i / segments) * math.tau
-        x = math.cos(t) * 0.5
-        z = math.sin(t) * 0.5
-        u = i / segments
-
-        # Bottom and top ring vertices for smooth side normals
-        vertices.extend([x, -0.5, z, x * 2.0, 0.0, z * 2.0, u, 0.0])
-        vertices.extend([x, 0.5, z, x * 2.0, 0.0, z * 2.0, u, 1.0])
-
-    for i in range(segments):
-        base = i * 2
-        indices.extend([base, base + 1, base + 3, base, base + 3, base + 2])
-
-    # Top cap
-    top_center_idx = len(vertices) // 8
-    vertices.extend([0.0, 0.5, 0.0, 0.0, 1.0, 0.0, 0.5, 0.5])
-    for i in range(segments):
-        t = (i / segments) * math.tau
-        x = math.cos(t) * 0.5
-        z = math.sin(t) * 0.5
-        vertices.extend([x, 0.5, z, 0.0, 1.0, 0.0, (x + 0.5), (z + 0.5)])
-    for i in range(segments):
-        a = top_center_idx + 1 + i
-        b = top_center_idx + 1 + ((i + 1) % segments)
-        indices.extend([top_center_idx, a, b])
-
-    # Bottom cap
-    bottom_center_idx = len(vertices) // 8
-    vertices.extend([0.0, -0.5, 0.0, 0.0, -1.0, 0.0, 0.5, 0.5])
-    for i in range(segments):
-        t = (i / segments) * math.tau
-        x = math.cos(t) * 0.5
-        z = math.sin(t) * 0.5
-        vertices.extend([x, -0.5, z, 0.0, -1.0, 0.0, (x + 0.5), (z + 0.5)])
-    for i in range(segments):
-        a = bottom_center_idx + 1 + i
-        b = bottom_center_idx + 1 + ((i + 1) % segments)
-        indices.extend([bottom_center_idx, b, a])
-
-    return np.array(vertices, dtype="f4"), np.array(indices, dtype="i4")
+    # Side surface: bottom and top ring vertices per step for smooth side normals.
+    x, z = _ring(segments, segments + 1)
+    side = np.zeros((segments + 1, 2, 8))
+    side[:, :, 0] = x[:, None]
+    side[:, 0, 1] = -0.5
+    side[:, 1, 1] = 0.5
+    side[:, :, 2] = z[:, None]
+    side[:, :, 3] = (x * 2.0)[:, None]
+    side[:, :, 5] = (z * 2.0)[:, None]
+    side[:, :, 6] = (np.arange(segments + 1) / segments)[:, None]
+    side[:, 1, 7] = 1.0
+    base = 2 * np.arange(segments)
+    side_indices = np.column_stack((base, base + 1, base + 3, base, base + 3, base + 2)).ravel()
+
+    top_start = 2 * (segments + 1)
+    top, top_indices = _disc_cap(segments, 0.5, top_start, facing_up=True)
+    bottom, bottom_indices = _disc_cap(segments, -0.5, top_start + segments + 1, facing_up=False)
+
+    vertices = np.concatenate((side.reshape(-1, 8), top, bottom))
+    indices = np.concatenate((side_indices, top_indices, bottom_indices))
+    return vertices.astype("f4").ravel(), indices.astype("i4")
 
 
 def _cone_geometry(segments: int = 20) -> Tuple[np.ndarray, np.ndarray]:
-    vertices: List[float] = []
-    indices: List[int] = []
+    # Side surface (flat-ish faces for readable silhouette): one triangle per step.
+    x, z = _ring(segments, segments + 1)
+    rim = np.column_stack((x, np.full(segments + 1, -0.5), z)).astype("f4")
+    p0, p1 = rim[:-1], rim[1:]
     apex = np.array([0.0, 0.5, 0.0], dtype="f4")
-
-    # Side surface (flat-ish faces for readable silhouette)
-    for i in range(segments):
-        t0 = (i / segments) * math.tau
-        t1 = ((i + 1) / segments) * math.tau
-        p0 = np.array([math.cos(t0) * 0.5, -0.5, math.sin(t0) * 0.5], dtype="f4")
-        p1 = np.array([math.cos(t1) * 0.5, -0.5, math.sin(t1) * 0.5], dtype="f4")
-        normal = normalize(np.cross(p1 - p0, apex - p0))
-
-        base_idx = len(vertices) // 8
-        vertices.extend([apex[0], apex[1], apex[2], normal[0], normal[1], normal[2], 0.5, 1.0])
-        vertices.extend([p0[0], p0[1], p0[2], normal[0], normal[1], normal[2], 0.0, 0.0])
-        vertices.extend([p1[0], p1[1], p1[2], normal[0], normal[1], normal[2], 1.0, 0.0])
-        indices.extend([base_idx, base_idx + 1, base_idx + 2])
-
-    # Bottom cap
-    center_idx = len(vertices) // 8
-    vertices.extend([0.0, -0.5, 0.0, 0.0, -1.0, 0.0, 0.5, 0.5])
-    for i in range(segments):
-        t = (i / segments) * math.tau
-        x = math.cos(t) * 0.5
-        z = math.sin(t) * 0.5
-        vertices.extend([x, -0.5, z, 0.0, -1.0, 0.0, (x + 0.5), (z + 0.5)])
-    for i in range(segments):
-        a = center_idx + 1 + i
-        b = center_idx + 1 + ((i + 1) % segments)
-        indices.extend([center_idx, b, a])
-
-    return np.array(vertices, dtype="f4"), np.array(indices, dtype="i4")
+    normals = np.cross(p1 - p0, apex - p0)
+    normals /= np.sqrt(np.square(normals, dtype="f8").sum(axis=1)).astype("f4")[:, None]
+
+    side = np.zeros((segments, 3, 8), dtype="f4")
+    side[:, 0, 0:3] = apex
+    side[:, 1, 0:3] = p0
+    side[:, 2, 0:3] = p1
+    side[:, :, 3:6] = normals[:, None, :]
+    side[:, :, 6:8] = ((0.5, 1.0), (0.0, 0.0), (1.0, 0.0))
+
+    bottom, bottom_indices = _disc_cap(segments, -0.5, 3 * segments, facing_up=False)
+    vertices = np.concatenate((side.reshape(-1, 8), bottom.astype("f4")))
+    indices = np.concatenate((np.arange(3 * segments), bottom_indices))
+    return vertices.ravel(), indices.astype("i4")
+
+
+# Uploaded vertex layout: full-precision positions, half-float normals and UVs.
+# Half floats hold the axis-aligned normals and 0/1 UVs exactly, and the padding
+# keeps the UVs 4-byte aligned, for 24 bytes per vertex instead of 32.
+VERTEX_DTYPE = np.dtype([("position", "f4", 3), ("normal", "f2", 3), ("pad", "V2"), ("uv", "f2", 2)])
+_VERTEX_FORMAT = "3f 3f2 2x 2f2"
+_SHADOW_VERTEX_FORMAT = f"3f {VERTEX_DTYPE.itemsize - 12}x"
+
+
+def _pack_vertices(vertices: np.ndarray) -> np.ndarray:
+    """Pack flat ``(x, y, z, nx, ny, nz, u, v)`` float rows into ``VERTEX_DTYPE``."""
+    rows = vertices.reshape(-1, 8)
+    packed = np.zeros(len(rows), dtype=VERTEX_DTYPE)
+    packed["position"] = rows[:, 0:3]
+    packed["normal"] = rows[:, 3:6]
+    packed["uv"] = rows[:, 6:8]
+    return packed
+
+
+# Every mesh's packed vertex and index arrays, built once at import and shared
+# by all renderers. Buffers read them through the buffer protocol, with no bytes copy.
+_MESH_DATA: Dict[str, Tuple[np.ndarray, np.ndarray]] = {
+    name: (_pack_vertices(vertices), indices)
+    for name, (vertices, indices) in (
+        ("cube", (_CUBE_VERTICES, _CUBE_INDICES)),
+        ("cylinder", _cylinder_geometry(24)),
+        ("cone", _cone_geometry(24)),
+    )
+}
 
 
 class ChessRenderer:
@@ -427,6 +350,7 @@ class ChessRenderer:
         self.board_height = 2.4
         self.elapsed = 0.0
         self.motion_blur = 0.0
+        self.bloom_strength = 1.24
         self.rng = random.Random(3441)
 
         self.game = ChessGameState()
@@ -450,22 +374,24 @@ class ChessRenderer:
         self.tile_objects: Dict[int, RenderObject] = {}
         self.tile_base_materials: Dict[int, MaterialDef] = {}
         self.piece_objects: List[RenderObject] = []
-        self.rain_drops: List[RainDrop] = []
-        self.pulsing_objects: List[Tuple[RenderObject, MaterialDef]] = []
+        self._piece_object_cache: Dict[Tuple[int, int, bool], Tuple[RenderObject, ...]] = {}
+        self._placed_pieces: Optional[Dict[int, chess.Piece]] = None
+        self.selection_marker: Optional[RenderObject] = None
+        self.pulsing_objects: List[RenderObject] = []
+        self.material_palette = MaterialPalette(
+            value for value in vars(CyberpunkMaterials).values() if isinstance(value, MaterialDef)
+        )
 
         self._build_environment()
         self._build_board()
+        self._build_static_batch()
         self._build_rain()
         self._rebuild_pieces()
+        self._update_selection_marker()
         self._set_turn_camera_pose()
         
         # Cache uniform locations for render loop performance
         self._cache_uniform_locations()
-        
-        # Cache for picking ray calculations
-        self._cached_inv_vp: Optional[np.ndarray] = None
-        self._cached_view_hash: Optional[int] = None
-        self._cached_proj_hash: Optional[int] = None
 
     def _load_program(self, vertex_name: str, fragment_name: str) -> moderngl.Program:
         return self.ctx.program(
@@ -476,7 +402,6 @@ class ChessRenderer:
     def _cache_uniform_locations(self) -> None:
         """Cache uniform locations to avoid string lookups in render loop."""
         prog = self.scene_program
-        self.u_model = prog.get("uModel", None)
         self.u_view = prog.get("uView", None)
         self.u_projection = prog.get("uProjection", None)
         self.u_light_space = prog.get("uLightSpaceMatrix", None)
@@ -484,44 +409,33 @@ class ChessRenderer:
         self.u_time = prog.get("uTime", None)
         self.u_shadow_map = prog.get("uShadowMap", None)
         self.u_skybox = prog.get("uSkybox", None)
-        
-        # Material uniforms
-        self.u_mat_albedo = prog.get("uMaterial.albedo", None)
-        self.u_mat_metallic = prog.get("uMaterial.metallic", None)
-        self.u_mat_roughness = prog.get("uMaterial.roughness", None)
-        self.u_mat_specular = prog.get("uMaterial.specular", None)
-        self.u_mat_emissive = prog.get("uMaterial.emissive", None)
+        # Material palette: every material once, indexed per instance.
+        self.material_ubo = self.ctx.buffer(reserve=MAX_MATERIALS * MATERIAL_STRIDE, dynamic=True)
+        self._material_revision = -1
+        if MATERIAL_BLOCK_NAME in prog:
+            prog[MATERIAL_BLOCK_NAME].binding = MATERIAL_BLOCK_BINDING
+        # Sampler units never change; bind them once.
+        if self.u_shadow_map is not None:
+            self.u_shadow_map.value = 0
+        if self.u_skybox is not None:
+            self.u_skybox.value = 1
         
         # Depth program uniforms
-        self.depth_u_model = self.depth_program.get("uModel", None)
         self.depth_u_light_space = self.depth_program.get("uLightSpaceMatrix", None)
 
     def _build_meshes(self) -> Dict[str, MeshBundle]:
-        def build_mesh(vertices: np.ndarray, indices: np.ndarray) -> MeshBundle:
-            vbo = self.ctx.buffer(vertices.tobytes())
-            ibo = self.ctx.buffer(indices.tobytes())
-            pos_vbo = self.ctx.buffer(vertices.reshape(-1, 8)[:, 0:3].astype("f4").tobytes())
-
-            vao_scene = self.ctx.vertex_array(
-                self.scene_program,
-                [(vbo, "3f 3f 2f", "in_position", "in_normal", "in_uv")],
-                ibo,
-            )
-            vao_shadow = self.ctx.vertex_array(
-                self.depth_program,
-                [(pos_vbo, "3f", "in_position")],
-                ibo,
-            )
-            return MeshBundle(vao_scene=vao_scene, vao_shadow=vao_shadow)
-
-        cube_v, cube_i = _cube_geometry()
-        cyl_v, cyl_i = _cylinder_geometry(24)
-        cone_v, cone_i = _cone_geometry(24)
-        return {
-            "cube": build_mesh(cube_v, cube_i),
-            "cylinder": build_mesh(cyl_v, cyl_i),
-            "cone": build_mesh(cone_v, cone_i),
-        }
+        # Geometry buffers are uploaded once per context and shared by every renderer on
+        # it; stored on the context so they live exactly as long as it does. VAOs and
+        # instance buffers stay per renderer and are created in _reserve_instances.
+        if self.ctx.extra is None:
+            self.ctx.extra = {}
+        buffers = self.ctx.extra.get("mesh_buffers")
+        if buffers is None:
+            buffers = self.ctx.extra["mesh_buffers"] = {
+                name: (self.ctx.buffer(vertices), self.ctx.buffer(indices))
+                for name, (vertices, indices) in _MESH_DATA.items()
+            }
+        return {name: MeshBundle(vbo=vbo, ibo=ibo) for name, (vbo, ibo) in buffers.items()}
 
     def _build_environment(self) -> None:
         # Larger reflective plaza beneath board.
@@ -556,7 +470,7 @@ class ChessRenderer:
                     pulse_strength=0.22,
                 )
                 self.static_objects.append(seg)
-                self.pulsing_objects.append((seg, mat))
+                self.pulsing_objects.append(seg)
 
         # Skyline ring 1: medium towers.
         for i in range(48):
@@ -589,7 +503,7 @@ class ChessRenderer:
                     pulse_strength=0.35,
                 )
                 self.static_objects.append(strip)
-                self.pulsing_objects.append((strip, mat))
+                self.pulsing_objects.append(strip)
 
         # Skyline ring 2: tall distant spires for depth.
         for i in range(64):
@@ -626,7 +540,7 @@ class ChessRenderer:
                 pulse_strength=0.40,
             )
             self.static_objects.append(spire)
-            self.pulsing_objects.append((spire, spire.material))
+            self.pulsing_objects.append(spire)
 
         # Floating billboard shards for skyline character.
         for _ in range(20):
@@ -645,7 +559,7 @@ class ChessRenderer:
                 pulse_strength=0.45,
             )
             self.static_objects.append(panel)
-            self.pulsing_objects.append((panel, panel.material))
+            self.pulsing_objects.append(panel)
 
     @staticmethod
     def _in_board_core(x: float, z: float) -> bool:
@@ -692,7 +606,7 @@ class ChessRenderer:
         for pos, scale, mat in edges:
             edge = RenderObject("cube", _model_matrix(pos, scale), mat, cast_shadow=False, pulse_speed=2.0, pulse_phase=0.0, pulse_strength=0.2)
             self.static_objects.append(edge)
-            self.pulsing_objects.append((edge, mat))
+            self.pulsing_objects.append(edge)
 
         for rank in range(8):
             for file_idx in range(8):
@@ -709,132 +623,141 @@ class ChessRenderer:
                 self.tile_objects[square] = tile
                 self.tile_base_materials[square] = mat
 
+    def _build_static_batch(self) -> None:
+        # Static objects never move or change material, so they are packed once into
+        # ready-to-upload instance rows; culling then selects rows with boolean masks.
+        statics = self.static_objects
+        slot = self.material_palette.slot
+        self._static_instances = np.zeros(len(statics), dtype=INSTANCE_DTYPE)
+        self._static_instances["model"] = np.stack([obj.model for obj in statics])
+        self._static_instances["material"] = [slot(obj.material) for obj in statics]
+        self._static_instances["emissive_scale"] = 1.0
+        self._static_emissive = self._static_instances["emissive_scale"]
+        self._static_casts = np.array([obj.cast_shadow for obj in statics])
+        self._static_mesh_rows = {name: np.array([obj.mesh == name for obj in statics]) for name in self.meshes}
+
+        # Every mesh fits in a unit cube, so a bounding box is the model's basis rows, halved.
+        models = self._static_instances["model"]
+        self._static_centers = models[:, 3, :3].copy()
+        self._static_half_axes = models[:, :3, :3] * 0.5
+
+        # Tiles never move either; only their material column follows the selection.
+        self._tile_squares = list(self.tile_objects)
+        self._tile_instances = np.zeros(len(self._tile_squares), dtype=INSTANCE_DTYPE)
+        self._tile_instances["model"] = np.stack([self.tile_objects[square].model for square in self._tile_squares])
+        self._tile_instances["emissive_scale"] = 1.0
+        # Shadow-caster rows are filled in by _update_static_casters on first upload.
+        self._static_light_revision = -1
+
+        # Pulse parameters as columns so update() evaluates every pulse with one np.sin
+        # and scatters the results straight into the batch's emissive column.
+        rows = {id(obj): row for row, obj in enumerate(statics)}
+        self._pulse_rows = np.array([rows[id(obj)] for obj in self.pulsing_objects], dtype=np.intp)
+        # Kept in float64: elapsed time grows without bound and the phase must stay precise.
+        self._pulse_speeds = np.array([obj.pulse_speed for obj in self.pulsing_objects])
+        self._pulse_phases = np.array([obj.pulse_phase for obj in self.pulsing_objects])
+        self._pulse_strengths = np.array([obj.pulse_strength for obj in self.pulsing_objects])
+        # Reused every frame so the pulse update allocates nothing.
+        self._pulse_scratch = np.empty(len(self.pulsing_objects))
+
     def _build_rain(self) -> None:
-        for _ in range(320):
-            x = self.rng.uniform(-34.0, 34.0)
-            y = self.rng.uniform(5.0, 25.0)
-            z = self.rng.uniform(-34.0, 34.0)
-            speed = self.rng.uniform(10.0, 16.0)
-            drift = self.rng.uniform(-0.55, 0.55)
-            length = self.rng.uniform(0.32, 0.72)
-            obj = RenderObject(
-                "cube",
-                _model_matrix((x, y, z), (0.014, length, 0.014)),
-                CyberpunkMaterials.RAIN_STREAK,
-                cast_shadow=False,
-            )
-            self.rain_drops.append(RainDrop(x=x, y=y, z=z, speed=speed, drift=drift, length=length, render_obj=obj))
+        # Rain lives only in arrays: each row of rain_instances is a ready-to-upload
+        # cube instance, and the drop positions are a view of its translation row.
+        state = np.array(
+            [
+                (
+                    self.rng.uniform(-34.0, 34.0),
+                    self.rng.uniform(5.0, 25.0),
+                    self.rng.uniform(-34.0, 34.0),
+                    self.rng.uniform(10.0, 16.0),
+                    self.rng.uniform(-0.55, 0.55),
+                    self.rng.uniform(0.32, 0.72),
+                )
+                for _ in range(RAIN_DROP_COUNT)
+            ],
+            dtype="f4",
+        )
+        self.rain_speeds = state[:, 3].copy()
+        self.rain_drifts = state[:, 4].copy()
+        self.rain_np_rng = np.random.default_rng(self.rng.getrandbits(32))
+
+        self.rain_instances = np.zeros(RAIN_DROP_COUNT, dtype=INSTANCE_DTYPE)
+        self.rain_instances["material"] = self.material_palette.slot(CyberpunkMaterials.RAIN_STREAK)
+        self.rain_instances["emissive_scale"] = 1.0
+        models = self.rain_instances["model"]
+        models[:, 0, 0] = RAIN_WIDTH
+        models[:, 1, 1] = state[:, 5]
+        models[:, 2, 2] = RAIN_WIDTH
+        models[:, 3, 3] = 1.0
+        self.rain_positions = models[:, 3, :3]
+        self.rain_positions[:] = state[:, :3]
 
     def _square_to_world(self, square: int) -> Tuple[float, float]:
         file_idx = chess.square_file(square)
         rank = chess.square_rank(square)
         return file_idx - 3.5, rank - 3.5
 
-    def _piece_parts(self, piece_type: int) -> List[PiecePart]:
-        base: List[PiecePart] = [
-            PiecePart("cylinder", (0.0, 0.05, 0.0), (0.58, 0.08, 0.58)),
-            PiecePart("cylinder", (0.0, 0.11, 0.0), (0.44, 0.04, 0.44)),
-        ]
-
-        if piece_type == chess.PAWN:
-            return base + [
-                PiecePart("cylinder", (0.0, 0.23, 0.0), (0.24, 0.20, 0.24)),
-                PiecePart("cylinder", (0.0, 0.36, 0.0), (0.16, 0.10, 0.16)),
-                PiecePart("cone", (0.0, 0.50, 0.0), (0.15, 0.14, 0.15)),
-            ]
-
-        if piece_type == chess.ROOK:
-            return base + [
-                PiecePart("cylinder", (0.0, 0.28, 0.0), (0.34, 0.30, 0.34)),
-                PiecePart("cylinder", (0.0, 0.50, 0.0), (0.44, 0.10, 0.44)),
-                PiecePart("cube", (-0.20, 0.62, -0.20), (0.10, 0.10, 0.10)),
-                PiecePart("cube", (-0.20, 0.62, 0.20), (0.10, 0.10, 0.10)),
-                PiecePart("cube", (0.20, 0.62, -0.20), (0.10, 0.10, 0.10)),
-                PiecePart("cube", (0.20, 0.62, 0.20), (0.10, 0.10, 0.10)),
-            ]
-
-        if piece_type == chess.KNIGHT:
-            return base + [
-                PiecePart("cylinder", (0.0, 0.24, 0.0), (0.30, 0.18, 0.30)),
-                PiecePart("cube", (0.0, 0.42, -0.03), (0.22, 0.24, 0.30)),
-                PiecePart("cube", (0.0, 0.62, 0.08), (0.14, 0.30, 0.18)),
-                PiecePart("cube", (0.0, 0.80, 0.15), (0.10, 0.10, 0.14)),
-                PiecePart("cube", (0.06, 0.88, 0.13), (0.03, 0.10, 0.03)),
-                PiecePart("cube", (-0.06, 0.88, 0.13), (0.03, 0.10, 0.03)),
-                PiecePart("cube", (0.0, 0.68, -0.12), (0.04, 0.22, 0.08)),
-            ]
-
-        if piece_type == chess.BISHOP:
-            return base + [
-                PiecePart("cylinder", (0.0, 0.24, 0.0), (0.28, 0.20, 0.28)),
-                PiecePart("cylinder", (0.0, 0.45, 0.0), (0.20, 0.26, 0.20)),
-                PiecePart("cone", (0.0, 0.68, 0.0), (0.14, 0.24, 0.14)),
-                PiecePart("cylinder", (0.0, 0.83, 0.0), (0.08, 0.08, 0.08)),
-                PiecePart("cube", (0.0, 0.72, 0.12), (0.02, 0.20, 0.04)),
-            ]
-
-        if piece_type == chess.QUEEN:
-            return base + [
-                PiecePart("cylinder", (0.0, 0.27, 0.0), (0.30, 0.24, 0.30)),
-                PiecePart("cylinder", (0.0, 0.48, 0.0), (0.22, 0.18, 0.22)),
-                PiecePart("cylinder", (0.0, 0.62, 0.0), (0.34, 0.07, 0.34)),
-                PiecePart("cylinder", (0.0, 0.75, 0.0), (0.12, 0.10, 0.12)),
-                PiecePart("cone", (-0.16, 0.82, 0.0), (0.05, 0.12, 0.05)),
-                PiecePart("cone", (0.16, 0.82, 0.0), (0.05, 0.12, 0.05)),
-                PiecePart("cone", (0.0, 0.82, -0.16), (0.05, 0.12, 0.05)),
-                PiecePart("cone", (0.0, 0.82, 0.16), (0.05, 0.12, 0.05)),
-                PiecePart("cone", (0.0, 0.88, 0.0), (0.06, 0.10, 0.06)),
-            ]
-
-        if piece_type == chess.KING:
-            return base + [
-                PiecePart("cylinder", (0.0, 0.28, 0.0), (0.30, 0.24, 0.30)),
-                PiecePart("cylinder", (0.0, 0.50, 0.0), (0.22, 0.22, 0.22)),
-                PiecePart("cylinder", (0.0, 0.70, 0.0), (0.12, 0.12, 0.12)),
-                PiecePart("cylinder", (0.0, 0.84, 0.0), (0.04, 0.22, 0.04)),
-                PiecePart("cube", (0.0, 0.91, 0.0), (0.22, 0.04, 0.04)),
-                PiecePart("cube", (0.0, 0.96, 0.0), (0.04, 0.14, 0.04)),
-            ]
-
-        return base
+    def _piece_render_objects(self, square: int, piece_type: int, color: bool) -> Tuple[RenderObject, ...]:
+        # Squares sit on a fixed grid, so a piece's parts on a square are built once.
+        key = (square, piece_type, color)
+        objects = self._piece_object_cache.get(key)
+        if objects is not None:
+            return objects
+
+        x, z = self._square_to_world(square)
+        base_y = self.board_height + 0.05
+        mat = CyberpunkMaterials.WHITE_PIECE if color == chess.WHITE else CyberpunkMaterials.BLACK_PIECE
+        offsets, scales, yaws = _PIECE_PART_COLUMNS[piece_type]
+        # One batched build for all of the piece's parts instead of a call per part.
+        models = _model_matrices(offsets + (x, base_y, z), scales, yaws)
+        objects = tuple(
+            RenderObject(part.mesh, model, mat, cast_shadow=True)
+            for part, model in zip(_PIECE_PARTS[piece_type], models)
+        )
+        self._piece_object_cache[key] = objects
+        return objects
 
     def _rebuild_pieces(self) -> None:
-        self.piece_objects.clear()
-        for square, piece in self.game.board.piece_map().items():
-            x, z = self._square_to_world(square)
-            base_y = self.board_height + 0.05
-            mat = CyberpunkMaterials.WHITE_PIECE if piece.color == chess.WHITE else CyberpunkMaterials.BLACK_PIECE
-
-            for part in self._piece_parts(piece.piece_type):
-                world_pos = (x + part.offset[0], base_y + part.offset[1], z + part.offset[2])
-                self.piece_objects.append(
-                    RenderObject(
-                        part.mesh,
-                        _model_matrix(world_pos, part.scale, yaw_degrees=part.yaw_degrees),
-                        mat,
-                        cast_shadow=True,
-                    )
-                )
+        piece_map = self.game.board.piece_map()
+        # A reset of an untouched board changes nothing; keep the packed records.
+        if piece_map == self._placed_pieces:
+            return
+        self._placed_pieces = piece_map
 
-            if square == self.game.selected_square:
-                self.piece_objects.append(
-                    RenderObject(
-                        "cube",
-                        _model_matrix((x, base_y + 0.02, z), (0.72, 0.04, 0.72)),
-                        CyberpunkMaterials.PIECE_SELECTION,
-                        cast_shadow=False,
-                    )
-                )
+        self.piece_objects.clear()
+        for square, piece in piece_map.items():
+            self.piece_objects.extend(self._piece_render_objects(square, piece.piece_type, piece.color))
+
+        # Pieces only change here, so their instance records are packed once per move
+        # rather than every frame.
+        casters: Dict[str, List[bytes]] = {name: [] for name in self.meshes}
+        others: Dict[str, List[bytes]] = {name: [] for name in self.meshes}
+        slot = self.material_palette.slot
+        for piece in self.piece_objects:
+            record = piece.model_bytes + _INSTANCE_TAIL.pack(slot(piece.material), 1.0)
+            (casters if piece.cast_shadow else others)[piece.mesh].append(record)
+        self._piece_caster_records = {name: b"".join(records) for name, records in casters.items()}
+        self._piece_other_records = {name: b"".join(records) for name, records in others.items()}
+
+    def _update_selection_marker(self) -> None:
+        # Kept apart from piece_objects so a selection change does not rebuild every piece.
+        square = self.game.selected_square
+        if square is None or self.game.board.piece_at(square) is None:
+            self.selection_marker = None
+            return
+        x, z = self._square_to_world(square)
+        self.selection_marker = RenderObject(
+            "cube",
+            _model_matrix((x, self.board_height + 0.07, z), (0.72, 0.04, 0.72)),
+            CyberpunkMaterials.PIECE_SELECTION,
+            cast_shadow=False,
+        )
 
     def resize(self, width: int, height: int) -> None:
         self.width = max(1, width)
         self.height = max(1, height)
         self.post.resize(self.width, self.height)
         self.ctx.viewport = (0, 0, self.width, self.height)
-        # Invalidate picking cache on resize
-        self._cached_inv_vp = None
-        self._cached_view_hash = None
-        self._cached_proj_hash = None
 
     def on_mouse_move(self, x: float, y: float) -> None:
         self.cursor_x = x
@@ -873,46 +796,25 @@ class ChessRenderer:
 
     def _pick_square(self, mouse_x: float, mouse_y: float) -> Optional[int]:
         aspect = self.width / max(1, self.height)
-        # Uniform matrices are uploaded in OpenGL column-major order.
-        # Use the same convention here so unprojection matches what is rendered.
-        view = self.camera.view_matrix().T
-        proj = self.camera.projection_matrix(aspect).T
-        
-        # Cache the expensive matrix inverse operation
-        view_hash = hash(view.tobytes())
-        proj_hash = hash(proj.tobytes())
-        
-        if (self._cached_inv_vp is None or 
-            self._cached_view_hash != view_hash or 
-            self._cached_proj_hash != proj_hash):
-            self._cached_inv_vp = np.linalg.inv(proj @ view)
-            self._cached_view_hash = view_hash
-            self._cached_proj_hash = proj_hash
-        
-        inv = self._cached_inv_vp
-
-        x_ndc = (2.0 * mouse_x / self.width) - 1.0
-        y_ndc = 1.0 - (2.0 * mouse_y / self.height)
-        near = np.array([x_ndc, y_ndc, -1.0, 1.0], dtype="f4")
-        far = np.array([x_ndc, y_ndc, 1.0, 1.0], dtype="f4")
-
-        near_world = inv @ near
-        far_world = inv @ far
-        near_world /= near_world[3]
-        far_world /= far_world[3]
-
-        ray_origin = near_world[:3]
-        ray_dir = normalize(far_world[:3] - near_world[:3])
-        if abs(ray_dir[1]) < 1e-6:
+        # The view is a rigid transform, so the pick ray comes straight from the camera's
+        # basis and the projection's focal scales; no general 4x4 inverse is needed.
+        view = self.camera.view_matrix().tolist()
+        proj = self.camera.projection_matrix(aspect)
+        vx = ((2.0 * mouse_x / self.width) - 1.0) / float(proj[0, 0])
+        vy = (1.0 - (2.0 * mouse_y / self.height)) / float(proj[1, 1])
+        # In pyrr's row layout the first three rows hold the right, up and -forward columns.
+        dx, dy, dz = (vx * row[0] + vy * row[1] - row[2] for row in view[:3])
+        ox, oy, oz = self.camera.eye.tolist()
+
+        # The direction stays unnormalized: t scales with it, so the hit point is unchanged.
+        if abs(dy) < 1e-6 * math.hypot(dx, dy, dz):
             return None
 
-        t = (self.board_height - ray_origin[1]) / ray_dir[1]
+        t = (self.board_height - oy) / dy
         if t < 0.0:
             return None
-        hit = ray_origin + (ray_dir * t)
-
-        file_idx = int(math.floor(hit[0] + 4.0))
-        rank = int(math.floor(hit[2] + 4.0))
+        file_idx = int(math.floor(ox + dx * t + 4.0))
+        rank = int(math.floor(oz + dz * t + 4.0))
         if 0 <= file_idx < 8 and 0 <= rank < 8:
             return chess.square(file_idx, rank)
         return None
@@ -949,8 +851,10 @@ class ChessRenderer:
         if moved:
             self.motion_blur = max(self.motion_blur, 0.85)
 
-        if board_changed or selection_changed:
+        if board_changed:
             self._rebuild_pieces()
+        if board_changed or selection_changed:
+            self._update_selection_marker()
 
     def turn_status_text(self) -> str:
         return self.game.turn_status_text()
@@ -971,47 +875,46 @@ class ChessRenderer:
         self.camera.update(dt)
         self.motion_blur = max(0.0, self.motion_blur - (dt * 1.8))
 
-        # Update pulsing materials by creating new MaterialDef instances
-        # (MaterialDef is frozen/immutable, so in-place updates are not possible)
-        for obj, base_mat in self.pulsing_objects:
-            pulse = 1.0 + (math.sin((self.elapsed * obj.pulse_speed) + obj.pulse_phase) * obj.pulse_strength)
-            emissive = tuple(channel * pulse for channel in base_mat.emissive)
-            obj.material = MaterialDef(
-                albedo=base_mat.albedo,
-                metallic=base_mat.metallic,
-                roughness=base_mat.roughness,
-                specular=base_mat.specular,
-                emissive=emissive,
+        # Pulses only scale the emissive term; the material itself never changes.
+        pulse = self._pulse_scratch
+        np.multiply(self._pulse_speeds, self.elapsed, out=pulse)
+        pulse += self._pulse_phases
+        np.sin(pulse, out=pulse)
+        pulse *= self._pulse_strengths
+        pulse += 1.0
+        self._static_emissive[self._pulse_rows] = pulse
+
+        positions = self.rain_positions
+        positions[:, 1] -= self.rain_speeds * dt
+        positions[:, 0] += self.rain_drifts * dt
+        respawn = positions[:, 1] < -1.3
+        count = int(np.count_nonzero(respawn))
+        if count:
+            rng = self.rain_np_rng
+            positions[respawn] = np.column_stack(
+                (rng.uniform(-34.0, 34.0, count), rng.uniform(8.0, 25.0, count), rng.uniform(-34.0, 34.0, count))
             )
 
-        for drop in self.rain_drops:
-            drop.y -= drop.speed * dt
-            drop.x += drop.drift * dt
-            if drop.y < -1.3:
-                drop.y = self.rng.uniform(8.0, 25.0)
-                drop.x = self.rng.uniform(-34.0, 34.0)
-                drop.z = self.rng.uniform(-34.0, 34.0)
-            drop.render_obj.model = _model_matrix((drop.x, drop.y, drop.z), (0.014, drop.length, 0.014))
-
     def render(self) -> None:
         aspect = self.width / max(1, self.height)
         view = self.camera.view_matrix()
         projection = self.camera.projection_matrix(aspect)
 
         self.shadow_mapper.update_light_matrix(self.lighting.directional.direction, (0.0, self.board_height, 0.0))
+        self._upload_instances(frustum_planes(view @ projection))
         self._render_shadow_pass()
 
         self.post.begin_scene()
         self.skybox.render(view, projection)
         self._render_scene_pass(view, projection)
-        self.post.apply_bloom(blur_passes=10)
+        self.post.apply_bloom(self.bloom_strength)
 
-        focus_depth = float(np.clip((self.camera.state.distance - 8.0) / 28.0, 0.25, 0.85))
-        dof_strength = float(np.clip(0.32 + ((1.0 - focus_depth) * 0.5), 0.2, 0.78))
-        camera_speed = float(np.clip(self.camera.velocity * 0.06, 0.0, 1.0))
+        focus_depth = clamp((self.camera.state.distance - 8.0) / 28.0, 0.25, 0.85)
+        dof_strength = clamp(0.32 + ((1.0 - focus_depth) * 0.5), 0.2, 0.78)
+        camera_speed = clamp(self.camera.velocity * 0.06, 0.0, 1.0)
         self.post.composite(
             exposure=1.08,
-            bloom_strength=1.24,
+            bloom_strength=self.bloom_strength,
             elapsed_time=self.elapsed,
             camera_speed=camera_speed,
             focus_depth=focus_depth,
@@ -1022,28 +925,26 @@ class ChessRenderer:
     def _render_shadow_pass(self) -> None:
         self.shadow_mapper.begin()
         if self.depth_u_light_space is not None:
-            self.depth_u_light_space.write(self.shadow_mapper.light_space.astype("f4").tobytes())
+            self.depth_u_light_space.write(self.shadow_mapper.light_space)
 
-        for obj in self.static_objects:
-            if obj.cast_shadow:
-                self._draw_shadow_object(obj)
-        for tile in self.tile_objects.values():
-            self._draw_shadow_object(tile)
-        for piece in self.piece_objects:
-            if piece.cast_shadow:
-                self._draw_shadow_object(piece)
+        for mesh in self.meshes.values():
+            if mesh.shadow_count:
+                mesh.vao_shadow.render(instances=mesh.shadow_count)
 
         self.shadow_mapper.end((self.width, self.height))
 
     def _render_scene_pass(self, view: np.ndarray, projection: np.ndarray) -> None:
+        # Camera and light matrices are contiguous float32 already; moderngl reads
+        # them through the buffer protocol without an astype/tobytes copy.
         if self.u_view is not None:
-            self.u_view.write(view.astype("f4").tobytes())
+            self.u_view.write(view)
         if self.u_projection is not None:
-            self.u_projection.write(projection.astype("f4").tobytes())
+            self.u_projection.write(projection)
         if self.u_light_space is not None:
-            self.u_light_space.write(self.shadow_mapper.light_space.astype("f4").tobytes())
+            self.u_light_space.write(self.shadow_mapper.light_space)
         if self.u_view_pos is not None:
-            self.u_view_pos.value = tuple(self.camera.eye.tolist())
+            # The eye is a contiguous float32 vec3, so it is written without a tuple round trip.
+            self.u_view_pos.write(self.camera.eye)
         if self.u_time is not None:
             self.u_time.value = self.elapsed
 
@@ -1052,39 +953,99 @@ class ChessRenderer:
 
         self.shadow_mapper.depth_texture.use(location=0)
         self.skybox.cubemap.use(location=1)
-        if self.u_shadow_map is not None:
-            self.u_shadow_map.value = 0
-        if self.u_skybox is not None:
-            self.u_skybox.value = 1
+        if self._material_revision != self.material_palette.revision:
+            self.material_ubo.write(self.material_palette.packed())
+            self._material_revision = self.material_palette.revision
+        self.material_ubo.bind_to_uniform_block(MATERIAL_BLOCK_BINDING)
+
+        for mesh in self.meshes.values():
+            if mesh.instance_count:
+                mesh.vao_scene.render(instances=mesh.instance_count)
+
+    def _update_static_casters(self) -> None:
+        # The light rarely moves, so which static objects shadow anything is only
+        # recomputed when the light matrix does.
+        if self._static_light_revision == self.shadow_mapper.revision:
+            return
+        self._static_light_revision = self.shadow_mapper.revision
+        light_planes = frustum_planes(self.shadow_mapper.light_space)
+        in_light = boxes_in_frustum(light_planes, self._static_centers, self._static_half_axes)
+        self._static_shadowing = self._static_casts & in_light
+        self._static_caster_rows = {
+            name: np.flatnonzero(self._static_shadowing & rows) for name, rows in self._static_mesh_rows.items()
+        }
 
-        for obj in self.static_objects:
-            self._draw_scene_object(obj, obj.material)
-        for square, tile in self.tile_objects.items():
-            self._draw_scene_object(tile, self._effective_tile_material(square))
-        for piece in self.piece_objects:
-            self._draw_scene_object(piece, piece.material)
-        for drop in self.rain_drops:
-            self._draw_scene_object(drop.render_obj, drop.render_obj.material)
-
-    def _draw_shadow_object(self, obj: RenderObject) -> None:
-        mesh = self.meshes[obj.mesh]
-        if self.depth_u_model is not None:
-            self.depth_u_model.write(obj.model.astype("f4").tobytes())
-        mesh.vao_shadow.render()
-
-    def _draw_scene_object(self, obj: RenderObject, material: MaterialDef) -> None:
-        mesh = self.meshes[obj.mesh]
-        if self.u_model is not None:
-            self.u_model.write(obj.model.astype("f4").tobytes())
-
-        if self.u_mat_albedo is not None:
-            self.u_mat_albedo.value = material.albedo
-        if self.u_mat_metallic is not None:
-            self.u_mat_metallic.value = material.metallic
-        if self.u_mat_roughness is not None:
-            self.u_mat_roughness.value = material.roughness
-        if self.u_mat_specular is not None:
-            self.u_mat_specular.value = material.specular
-        if self.u_mat_emissive is not None:
-            self.u_mat_emissive.value = material.emissive
-        mesh.vao_scene.render()
+    def _upload_instances(self, camera_planes: np.ndarray) -> None:
+        """Write every object's model matrix and material slot into its mesh's instance buffer."""
+        # Chunks are instance arrays or packed records; both are written as-is.
+        casters: Dict[str, List[Union[bytes, np.ndarray]]] = {name: [] for name in self.meshes}
+        others: Dict[str, List[Union[bytes, np.ndarray]]] = {name: [] for name in self.meshes}
+        slot = self.material_palette.slot
+
+        # Casters inside the light's frustum go in the shadow prefix even when off
+        # screen; casters outside it cannot shadow anything and cull like the rest.
+        self._update_static_casters()
+        in_view = boxes_in_frustum(camera_planes, self._static_centers, self._static_half_axes)
+        drawn = in_view & ~self._static_shadowing
+        for name, rows in self._static_mesh_rows.items():
+            casters[name].append(self._static_instances[self._static_caster_rows[name]])
+            others[name].append(self._static_instances[drawn & rows])
+        # Tiles always cast shadows, whatever their flag says.
+        tiles = self._tile_instances
+        tiles["material"] = [slot(self._effective_tile_material(square)) for square in self._tile_squares]
+        casters["cube"].append(tiles)
+        for name in self.meshes:
+            casters[name].append(self._piece_caster_records[name])
+            others[name].append(self._piece_other_records[name])
+        marker = self.selection_marker
+        if marker is not None:
+            others[marker.mesh].append(marker.model_bytes + _INSTANCE_TAIL.pack(slot(marker.material), 1.0))
+        # Rain rows are already instance records; the whole block goes in as one chunk.
+        others["cube"].append(self.rain_instances)
+
+        for name, mesh in self.meshes.items():
+            chunks = casters[name] + others[name]
+            sizes = [memoryview(chunk).nbytes for chunk in chunks]
+            mesh.shadow_count = sum(sizes[: len(casters[name])]) // _INSTANCE_STRIDE
+            mesh.instance_count = sum(sizes) // _INSTANCE_STRIDE
+            if not mesh.instance_count:
+                continue
+            self._reserve_instances(mesh, mesh.instance_count)
+            # Orphaning hands the driver fresh storage, so these writes never wait on
+            # last frame's draws still reading the old contents.
+            mesh.instance_vbo.orphan()
+            # Each chunk goes straight into place; nothing is joined into one copy first.
+            offset = 0
+            for chunk, size in zip(chunks, sizes):
+                if size:
+                    mesh.instance_vbo.write(chunk, offset=offset)
+                    offset += size
+
+    def _reserve_instances(self, mesh: MeshBundle, count: int) -> None:
+        if count <= mesh.instance_capacity:
+            return
+        # Grow geometrically so piece rebuilds rarely reallocate.
+        capacity = max(count, mesh.instance_capacity * 2, 64)
+        for resource in (mesh.vao_scene, mesh.vao_shadow, mesh.instance_vbo):
+            if resource is not None:
+                resource.release()
+
+        mesh.instance_vbo = self.ctx.buffer(reserve=capacity * _INSTANCE_STRIDE, dynamic=True)
+        mesh.instance_capacity = capacity
+        mesh.vao_scene = self.ctx.vertex_array(
+            self.scene_program,
+            [
+                (mesh.vbo, _VERTEX_FORMAT, "in_position", "in_normal", "in_uv"),
+                (mesh.instance_vbo, _INSTANCE_FORMAT, *_INSTANCE_ATTRIBUTES),
+            ],
+            mesh.ibo,
+        )
+        mesh.vao_shadow = self.ctx.vertex_array(
+            self.depth_program,
+            [
+                # Same vertex buffer as the scene pass; normals and UVs are skipped.
+                (mesh.vbo, _SHADOW_VERTEX_FORMAT, "in_position"),
+                (mesh.instance_vbo, _SHADOW_INSTANCE_FORMAT, "in_model"),
+            ],
+            mesh.ibo,
+        )
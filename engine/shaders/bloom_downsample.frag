@@ -0,0 +1,24 @@
+#version 330
+
+in vec2 vUv;
+out vec4 fragColor;
+
+uniform sampler2D uImage;
+// 1.0 / source size, set per pass by PostProcessingPipeline.
+uniform vec2 uTexel;
+
+// Only pixels brighter than 1.0 (after fog) feed the bloom.
+vec3 brightPass(vec3 color) {
+    float brightness = dot(color, vec3(0.2126, 0.7152, 0.0722));
+    return brightness > 1.0 ? color : vec3(0.0);
+}
+
+void main() {
+    // Each bilinear tap averages a 2x2 block, so four taps cover a 4x4 source footprint.
+    vec2 texel = uTexel;
+    vec3 result = brightPass(texture(uImage, vUv + vec2(-texel.x, -texel.y)).rgb);
+    result += brightPass(texture(uImage, vUv + vec2(texel.x, -texel.y)).rgb);
+    result += brightPass(texture(uImage, vUv + vec2(-texel.x, texel.y)).rgb);
+    result += brightPass(texture(uImage, vUv + vec2(texel.x, texel.y)).rgb);
+    fragColor = vec4(result * 0.25, 1.0);
+}
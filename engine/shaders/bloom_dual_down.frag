@@ -0,0 +1,19 @@
+#version 330
+
+in vec2 vUv;
+out vec4 fragColor;
+
+uniform sampler2D uImage;
+// 1.0 / source size, set per pass by PostProcessingPipeline.
+uniform vec2 uTexel;
+
+// Dual-filter downsample: weighted center plus four diagonal bilinear taps.
+void main() {
+    vec2 texel = uTexel;
+    vec3 result = texture(uImage, vUv).rgb * 4.0;
+    result += texture(uImage, vUv - texel).rgb;
+    result += texture(uImage, vUv + texel).rgb;
+    result += texture(uImage, vUv + vec2(texel.x, -texel.y)).rgb;
+    result += texture(uImage, vUv - vec2(texel.x, -texel.y)).rgb;
+    fragColor = vec4(result * 0.125, 1.0);
+}
@@ -0,0 +1,23 @@
+#version 330
+
+in vec2 vUv;
+out vec4 fragColor;
+
+uniform sampler2D uImage;
+// 1.0 / source size, set per pass by PostProcessingPipeline.
+uniform vec2 uTexel;
+
+// Dual-filter upsample: 8-tap tent over the lower-resolution source level.
+void main() {
+    vec2 texel = uTexel;
+    vec2 halfTexel = texel * 0.5;
+    vec3 result = texture(uImage, vUv + vec2(-texel.x, 0.0)).rgb;
+    result += texture(uImage, vUv + vec2(texel.x, 0.0)).rgb;
+    result += texture(uImage, vUv + vec2(0.0, texel.y)).rgb;
+    result += texture(uImage, vUv + vec2(0.0, -texel.y)).rgb;
+    result += texture(uImage, vUv + vec2(-halfTexel.x, halfTexel.y)).rgb * 2.0;
+    result += texture(uImage, vUv + vec2(halfTexel.x, halfTexel.y)).rgb * 2.0;
+    result += texture(uImage, vUv + vec2(halfTexel.x, -halfTexel.y)).rgb * 2.0;
+    result += texture(uImage, vUv + vec2(-halfTexel.x, -halfTexel.y)).rgb * 2.0;
+    fragColor = vec4(result / 12.0, 1.0);
+}
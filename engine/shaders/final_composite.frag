@@ -1,4 +1,6 @@
 #version 330
+// Set to 1 by PostProcessingPipeline when GL_FRAMEBUFFER_SRGB does the gamma encode.
+#define SRGB_OUTPUT 0
 
 in vec2 vUv;
 out vec4 fragColor;
@@ -14,6 +16,7 @@ uniform float uFocusDepth;
 uniform float uDofStrength;
 uniform float uMotionBlur;
 uniform vec2 uResolution;
+uniform vec2 uTexel;
 
 float random(vec2 p) {
     return fract(sin(dot(p, vec2(12.9898, 78.233))) * 43758.5453);
@@ -29,7 +32,7 @@ float luma(vec3 c) {
 }
 
 vec3 fxaaApprox(vec2 uv) {
-    vec2 texel = 1.0 / uResolution;
+    vec2 texel = uTexel;
     vec3 c = texture(uScene, uv).rgb;
     vec3 n = texture(uScene, uv + vec2(0.0, texel.y)).rgb;
     vec3 s = texture(uScene, uv - vec2(0.0, texel.y)).rgb;
@@ -47,7 +50,7 @@ vec3 applyMotionBlur(vec2 uv, float amount) {
     }
     vec2 center = vec2(0.5, 0.5);
     vec2 dir = normalize(uv - center + vec2(1e-5));
-    vec2 texel = 1.0 / uResolution;
+    vec2 texel = uTexel;
     vec3 accum = vec3(0.0);
     float total = 0.0;
     for (int i = -4; i <= 4; i++) {
@@ -70,7 +73,7 @@ void main() {
     float focus = smoothstep(0.0, 1.0, abs(depth - uFocusDepth) * 3.2);
     float dof = clamp(focus * uDofStrength, 0.0, 1.0);
 
-    vec2 texel = 1.0 / uResolution;
+    vec2 texel = uTexel;
     vec3 dofBlur = vec3(0.0);
     dofBlur += texture(uScene, uv + vec2(texel.x, 0.0)).rgb;
     dofBlur += texture(uScene, uv - vec2(texel.x, 0.0)).rgb;
@@ -88,13 +91,26 @@ void main() {
     colorOut = grade * colorOut;
 
     colorOut = tonemap(colorOut, uExposure);
+#if !SRGB_OUTPUT
     colorOut = pow(colorOut, vec3(1.0 / 2.2));
+#endif
 
     float vignette = smoothstep(0.9, 0.28, length(uv - vec2(0.5)));
-    colorOut *= mix(0.75, 1.0, vignette);
-
     float grain = (random(uv * uResolution * (1.0 + fract(uTime))) - 0.5) * 0.03;
+#if SRGB_OUTPUT
+    // The hardware encode runs after this shader, so both effects are mapped into
+    // linear space to match the default path, which applies them after gamma.
+    // A gamma-space scale is the 2.2 power of that scale in linear space.
+    colorOut *= pow(mix(0.75, 1.0, vignette), 2.2);
+    // Grain is scaled by the slope of the 2.2 decode, 2.2 * linear^0.545. sqrt()
+    // approximates the exponent, which leaves the deepest shadows slightly grainier
+    // than the default path. The hardware sRGB curve also differs a little from
+    // pow(1/2.2) near black.
+    colorOut += grain * 2.2 * sqrt(max(colorOut, vec3(0.0)));
+#else
+    colorOut *= mix(0.75, 1.0, vignette);
     colorOut += grain;
+#endif
 
     fragColor = vec4(colorOut, 1.0);
 }
@@ -1,42 +1,36 @@
 #version 330
 
-struct Material {
-    vec3 albedo;
-    float metallic;
-    float roughness;
-    float specular;
-    vec3 emissive;
-};
-
 struct DirectionalLight {
     vec3 direction;
     vec3 color;
     float intensity;
 };
 
+// Light structs are laid out for std140 and packed by SceneLighting.upload.
 struct PointLight {
     vec3 position;
-    vec3 color;
     float intensity;
+    vec3 color;
     float range;
 };
 
 struct SpotLight {
     vec3 position;
-    vec3 direction;
-    vec3 color;
     float intensity;
+    vec3 direction;
     float cutoffCos;
+    vec3 color;
     float range;
 };
 
-uniform Material uMaterial;
 uniform DirectionalLight uDirLight;
 uniform vec3 uAmbient;
 uniform int uPointLightCount;
-uniform PointLight uPointLights[8];
 uniform int uSpotLightCount;
-uniform SpotLight uSpotLights[2];
+layout(std140) uniform LightBlock {
+    PointLight uPointLights[8];
+    SpotLight uSpotLights[2];
+};
 uniform vec3 uViewPos;
 uniform sampler2D uShadowMap;
 uniform samplerCube uSkybox;
@@ -49,9 +43,14 @@ in vec3 vWorldPos;
 in vec3 vNormal;
 in vec2 vUv;
 in vec4 vLightSpacePos;
+// Material comes per instance; see pbr.vert.
+flat in vec3 vAlbedo;
+flat in float vMetallic;
+flat in float vRoughness;
+flat in float vSpecular;
+flat in vec3 vEmissive;
 
 layout (location = 0) out vec4 fragColor;
-layout (location = 1) out vec4 brightColor;
 
 float distributionGGX(vec3 N, vec3 H, float roughness) {
     float a = roughness * roughness;
@@ -160,9 +159,9 @@ vec3 shadeSpotLight(SpotLight light, vec3 N, vec3 V, vec3 F0, vec3 albedo, float
 void main() {
     vec3 N = normalize(vNormal);
     vec3 V = normalize(uViewPos - vWorldPos);
-    vec3 albedo = uMaterial.albedo;
-    float metallic = clamp(uMaterial.metallic, 0.0, 1.0);
-    float roughness = clamp(uMaterial.roughness, 0.04, 1.0);
+    vec3 albedo = vAlbedo;
+    float metallic = clamp(vMetallic, 0.0, 1.0);
+    float roughness = clamp(vRoughness, 0.04, 1.0);
 
     vec3 F0 = mix(vec3(0.04), albedo, metallic);
 
@@ -199,9 +198,9 @@ void main() {
     float rainFlicker = 0.96 + 0.04 * sin((vWorldPos.x + vWorldPos.z + uTime * 3.0) * 1.7);
     vec3 colorOut = (ambient + direct + pointAccum + spotAccum + reflection) * rainFlicker;
     float rim = pow(1.0 - max(dot(N, V), 0.0), 2.2);
-    vec3 rimLight = uDirLight.color * rim * (0.08 + uMaterial.specular * 0.06);
+    vec3 rimLight = uDirLight.color * rim * (0.08 + vSpecular * 0.06);
     colorOut += rimLight;
-    colorOut += uMaterial.emissive;
+    colorOut += vEmissive;
 
     float dist = length(uViewPos - vWorldPos);
     float heightFactor = clamp(exp(-max(vWorldPos.y - 0.25, 0.0) * uFogHeightFalloff), 0.0, 1.0);
@@ -211,11 +210,4 @@ void main() {
 
     vec3 fogged = mix(colorOut, uFogColor, clamp(fogAmount, 0.0, 1.0));
     fragColor = vec4(fogged, 1.0);
-
-    float brightness = dot(fogged, vec3(0.2126, 0.7152, 0.0722));
-    if (brightness > 1.0) {
-        brightColor = vec4(fogged, 1.0);
-    } else {
-        brightColor = vec4(0.0, 0.0, 0.0, 1.0);
-    }
 }
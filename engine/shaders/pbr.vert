@@ -4,7 +4,24 @@ in vec3 in_position;
 in vec3 in_normal;
 in vec2 in_uv;
 
-uniform mat4 uModel;
+// Per-instance attributes, written by ChessRenderer._upload_instances.
+in mat4 in_model;
+in int in_material;
+in float in_emissive_scale;
+
+// Laid out for std140 and packed by MaterialPalette.packed.
+struct Material {
+    vec3 albedo;
+    float metallic;
+    float roughness;
+    float specular;
+    vec3 emissive;
+};
+
+layout(std140) uniform MaterialBlock {
+    Material uMaterials[32];
+};
+
 uniform mat4 uView;
 uniform mat4 uProjection;
 uniform mat4 uLightSpaceMatrix;
@@ -13,12 +30,23 @@ out vec3 vWorldPos;
 out vec3 vNormal;
 out vec2 vUv;
 out vec4 vLightSpacePos;
+flat out vec3 vAlbedo;
+flat out float vMetallic;
+flat out float vRoughness;
+flat out float vSpecular;
+flat out vec3 vEmissive;
 
 void main() {
-    vec4 world = uModel * vec4(in_position, 1.0);
+    vec4 world = in_model * vec4(in_position, 1.0);
     vWorldPos = world.xyz;
-    vNormal = mat3(transpose(inverse(uModel))) * in_normal;
+    vNormal = mat3(transpose(inverse(in_model))) * in_normal;
     vUv = in_uv;
     vLightSpacePos = uLightSpaceMatrix * world;
+    Material material = uMaterials[in_material];
+    vAlbedo = material.albedo;
+    vMetallic = material.metallic;
+    vRoughness = material.roughness;
+    vSpecular = material.specular;
+    vEmissive = material.emissive * in_emissive_scale;
     gl_Position = uProjection * uView * world;
 }
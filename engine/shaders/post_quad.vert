@@ -1,11 +1,10 @@
 #version 330
 
-in vec2 in_position;
-in vec2 in_uv;
-
 out vec2 vUv;
 
 void main() {
-    vUv = in_uv;
-    gl_Position = vec4(in_position, 0.0, 1.0);
+    // Attribute-less fullscreen triangle: vertices 0, 1, 2 map to uv (0,0), (2,0), (0,2).
+    vec2 uv = vec2(float((gl_VertexID << 1) & 2), float(gl_VertexID & 2));
+    vUv = uv;
+    gl_Position = vec4(uv * 2.0 - 1.0, 0.0, 1.0);
 }
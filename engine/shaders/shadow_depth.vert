@@ -1,10 +1,10 @@
 #version 330
 
 in vec3 in_position;
+in mat4 in_model;
 
-uniform mat4 uModel;
 uniform mat4 uLightSpaceMatrix;
 
 void main() {
-    gl_Position = uLightSpaceMatrix * uModel * vec4(in_position, 1.0);
+    gl_Position = uLightSpaceMatrix * in_model * vec4(in_position, 1.0);
 }
@@ -1,7 +1,10 @@
 import numpy as np
-from pyrr import Matrix44, Vector3
 
-from .utils import normalize_safe
+from .utils import look_at, normalize_safe, orthographic
+
+# The light's box never changes size, so its projection is built once.
+_LIGHT_PROJECTION = orthographic(-20.0, 20.0, -20.0, 20.0, 0.5, 90.0, np.empty((4, 4), dtype="f4"))
+_LIGHT_PROJECTION.flags.writeable = False
 
 
 class ShadowMapper:
@@ -15,8 +18,16 @@ class ShadowMapper:
         self.depth_texture.compare_func = "<="
         self.depth_fbo = self.ctx.framebuffer(depth_attachment=self.depth_texture)
         self.light_space = np.eye(4, dtype="f4")
+        # Bumped whenever light_space changes, so callers can cache work derived from it.
+        self.revision = 0
+        self._light_key = None
 
     def update_light_matrix(self, direction: tuple[float, float, float], focus: tuple[float, float, float]) -> None:
+        key = (tuple(direction), tuple(focus))
+        if key == self._light_key:
+            return
+        self._light_key = key
+
         focus_v = np.array(focus, dtype="f4")
         light_dir = normalize_safe(
             np.array(direction, dtype="f4"),
@@ -24,14 +35,10 @@ class ShadowMapper:
         )
         light_pos = focus_v - (light_dir * 28.0)
 
-        view = Matrix44.look_at(
-            Vector3(light_pos.tolist()),
-            Vector3(focus_v.tolist()),
-            Vector3([0.0, 1.0, 0.0]),
-            dtype="f4",
-        )
-        proj = Matrix44.orthogonal_projection(-20.0, 20.0, -20.0, 20.0, 0.5, 90.0, dtype="f4")
-        self.light_space = np.array(proj * view, dtype="f4")
+        view = look_at(light_pos, focus_v, (0.0, 1.0, 0.0), np.empty((4, 4), dtype="f4"))
+        # Row-vector layout: the view applies first, so it is the left operand.
+        self.light_space = view @ _LIGHT_PROJECTION
+        self.revision += 1
 
     def begin(self) -> None:
         self.depth_fbo.use()
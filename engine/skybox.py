@@ -149,6 +149,10 @@ class SkyboxPass:
         )
         self.vbo = self.ctx.buffer(vertices.tobytes())
         self.vao = self.ctx.vertex_array(self.program, [(self.vbo, "3f", "in_position")])
+        self.program["uSkybox"].value = 0
+        self.u_view = self.program["uView"]
+        self.u_projection = self.program["uProjection"]
+        self._view_no_translation = np.empty((4, 4), dtype="f4")
 
         self.cubemap = self.ctx.texture_cube((128, 128), 3)
         self._build_cubemap()
@@ -184,15 +188,13 @@ class SkyboxPass:
             self.cubemap.write(face, gradient.tobytes())
 
     def render(self, view: np.ndarray, projection: np.ndarray) -> None:
-        view_no_translation = np.array(view, dtype="f4", copy=True)
-        view_no_translation[3, 0] = 0.0
-        view_no_translation[3, 1] = 0.0
-        view_no_translation[3, 2] = 0.0
+        view_no_translation = self._view_no_translation
+        np.copyto(view_no_translation, view)
+        view_no_translation[3, 0:3] = 0.0
 
         self.ctx.depth_func = "<="
         self.cubemap.use(location=0)
-        self.program["uSkybox"].value = 0
-        self.program["uView"].write(view_no_translation.astype("f4").tobytes())
-        self.program["uProjection"].write(projection.astype("f4").tobytes())
+        self.u_view.write(view_no_translation)
+        self.u_projection.write(projection)
         self.vao.render()
         self.ctx.depth_func = "<"
@@ -2,14 +2,26 @@
 
 from __future__ import annotations
 
+import functools
+import math
 from pathlib import Path
 
 import numpy as np
 
 
+def _length(v: np.ndarray) -> float:
+    # Scalar hypot is several times cheaper than np.linalg.norm for short vectors.
+    return math.hypot(*v.tolist())
+
+
+def clamp(value: float, low: float, high: float) -> float:
+    """Clamp a scalar; much cheaper than np.clip, which builds arrays even for floats."""
+    return min(max(value, low), high)
+
+
 def normalize(v: np.ndarray) -> np.ndarray:
     """Return unit-length vector, or the original vector if near-zero length."""
-    n = np.linalg.norm(v)
+    n = _length(v)
     if n < 1e-6:
         return v
     return v / n
@@ -17,7 +29,7 @@ def normalize(v: np.ndarray) -> np.ndarray:
 
 def normalize_safe(v: np.ndarray, fallback: np.ndarray | None = None) -> np.ndarray:
     """Return unit-length vector with a configurable fallback for zero-length input."""
-    n = np.linalg.norm(v)
+    n = _length(v)
     if n < 1e-6:
         if fallback is not None:
             return fallback
@@ -25,6 +37,89 @@ def normalize_safe(v: np.ndarray, fallback: np.ndarray | None = None) -> np.ndar
     return v / n
 
 
+def look_at(eye: np.ndarray, target: np.ndarray, up: tuple[float, float, float], out: np.ndarray) -> np.ndarray:
+    """Write a look-at view matrix into ``out`` using pyrr's row-vector layout."""
+    ex, ey, ez = float(eye[0]), float(eye[1]), float(eye[2])
+    fx, fy, fz = float(target[0]) - ex, float(target[1]) - ey, float(target[2]) - ez
+    f_len = math.sqrt(fx * fx + fy * fy + fz * fz) or 1.0
+    fx, fy, fz = fx / f_len, fy / f_len, fz / f_len
+
+    upx, upy, upz = up
+    sx, sy, sz = fy * upz - fz * upy, fz * upx - fx * upz, fx * upy - fy * upx
+    s_len = math.sqrt(sx * sx + sy * sy + sz * sz) or 1.0
+    sx, sy, sz = sx / s_len, sy / s_len, sz / s_len
+
+    ux, uy, uz = sy * fz - sz * fy, sz * fx - sx * fz, sx * fy - sy * fx
+    out[:] = (
+        (sx, ux, -fx, 0.0),
+        (sy, uy, -fy, 0.0),
+        (sz, uz, -fz, 0.0),
+        (-(sx * ex + sy * ey + sz * ez), -(ux * ex + uy * ey + uz * ez), fx * ex + fy * ey + fz * ez, 1.0),
+    )
+    return out
+
+
+def perspective(fov_y: float, aspect_ratio: float, near: float, far: float, out: np.ndarray) -> np.ndarray:
+    """Write a perspective projection into ``out`` using pyrr's row-vector layout."""
+    f = 1.0 / math.tan(math.radians(fov_y) * 0.5)
+    depth = far - near
+    out[:] = (
+        (f / aspect_ratio, 0.0, 0.0, 0.0),
+        (0.0, f, 0.0, 0.0),
+        (0.0, 0.0, -(far + near) / depth, -1.0),
+        (0.0, 0.0, -2.0 * far * near / depth, 0.0),
+    )
+    return out
+
+
+def orthographic(
+    left: float, right: float, bottom: float, top: float, near: float, far: float, out: np.ndarray
+) -> np.ndarray:
+    """Write an orthographic projection into ``out`` using pyrr's row-vector layout."""
+    width, height, depth = right - left, top - bottom, far - near
+    out[:] = (
+        (2.0 / width, 0.0, 0.0, 0.0),
+        (0.0, 2.0 / height, 0.0, 0.0),
+        (0.0, 0.0, -2.0 / depth, 0.0),
+        (-(right + left) / width, -(top + bottom) / height, -(far + near) / depth, 1.0),
+    )
+    return out
+
+
+def frustum_planes(view_projection: np.ndarray) -> np.ndarray:
+    """Return the six inward-facing, normalized clip planes as a (6, 4) array.
+
+    ``view_projection`` uses pyrr's row-vector layout (``view @ projection``), so
+    the clip-space rows of the Gribb-Hartmann extraction are its columns.
+    """
+    clip = view_projection.T
+    planes = np.stack(
+        (
+            clip[3] + clip[0],
+            clip[3] - clip[0],
+            clip[3] + clip[1],
+            clip[3] - clip[1],
+            clip[3] + clip[2],
+            clip[3] - clip[2],
+        )
+    )
+    planes /= np.linalg.norm(planes[:, :3], axis=1, keepdims=True)
+    return planes
+
+
+def boxes_in_frustum(planes: np.ndarray, centers: np.ndarray, half_axes: np.ndarray) -> np.ndarray:
+    """Return a boolean mask of the oriented boxes that touch the frustum given by ``planes``.
+
+    ``half_axes`` is (N, 3, 3): each box's three edge vectors, halved. Projecting them
+    onto a plane normal gives the box's exact extent along it, which stays tight for
+    the tall, thin towers where a bounding sphere would not.
+    """
+    distances = centers @ planes[:, :3].T + planes[:, 3]
+    extents = np.abs(half_axes @ planes[:, :3].T).sum(axis=1)
+    return (distances >= -extents).all(axis=1)
+
+
+@functools.cache
 def read_shader(path: Path) -> str:
-    """Read a shader or other text asset from disk."""
+    """Read a shader or other text asset from disk; each path is read once."""
     return path.read_text(encoding="utf-8")
@@ -50,16 +50,14 @@ class ChessGameState:
             self._select_square(square)
             return GameUpdate(selection_changed=True, focus_square=square)
 
-        # Cache legal moves to avoid multiple expensive generations.
-        legal_moves = self.board.legal_moves
-
+        # is_legal checks just this move instead of generating the whole move list.
         move = chess.Move(self.selected_square, square)
-        if move not in legal_moves:
+        if not self.board.is_legal(move):
             selected_piece = self.board.piece_at(self.selected_square)
             if selected_piece and selected_piece.piece_type == chess.PAWN and chess.square_rank(square) in (0, 7):
                 move = chess.Move(self.selected_square, square, promotion=chess.QUEEN)
 
-        if move in legal_moves:
+        if self.board.is_legal(move):
             captured = self.board.piece_at(move.to_square) is not None or self.board.is_en_passant(move)
             self.board.push(move)
             self.selected_square = None
@@ -106,4 +104,6 @@ class ChessGameState:
 
     def _select_square(self, square: int) -> None:
         self.selected_square = square
-        self.legal_targets = {move.to_square for move in self.board.legal_moves if move.from_square == square}
+        # The from-square mask makes the generator skip every other piece.
+        moves = self.board.generate_legal_moves(from_mask=chess.BB_SQUARES[square])
+        self.legal_targets = {move.to_square for move in moves}
@@ -0,0 +1,40 @@
+"""Shared test doubles for code that writes shader uniforms without a GL context."""
+
+from __future__ import annotations
+
+
+class FakeUniform:
+    """Uniform stand-in that counts value writes."""
+
+    def __init__(self) -> None:
+        self.writes = 0
+        self._value = None
+
+    @property
+    def value(self):
+        return self._value
+
+    @value.setter
+    def value(self, value) -> None:
+        self.writes += 1
+        self._value = value
+
+
+class FakeProgram:
+    """Program stand-in that exposes only the named uniforms."""
+
+    def __init__(self, names) -> None:
+        self.uniforms = {name: FakeUniform() for name in names}
+
+    def __contains__(self, name) -> bool:
+        return name in self.uniforms
+
+    def __getitem__(self, name) -> FakeUniform:
+        return self.uniforms[name]
+
+    def get(self, name, default=None):
+        return self.uniforms.get(name, default)
+
+    @property
+    def writes(self) -> int:
+        return sum(uniform.writes for uniform in self.uniforms.values())
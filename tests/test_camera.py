@@ -0,0 +1,122 @@
+"""Tests for engine.camera — cinematic camera smoothing and pose math."""
+
+from __future__ import annotations
+
+import math
+
+import numpy as np
+from pyrr import Matrix44, Vector3
+
+from engine.camera import CinematicCamera
+
+
+class TestCameraUpdate:
+    def test_update_reuses_buffers(self):
+        cam = CinematicCamera((0.0, 2.5, 0.0))
+        eye, target, focus = cam.eye, cam.target, cam.focus_target
+        cam.focus_on((1.0, 2.5, -1.0))
+        for _ in range(10):
+            cam.update(1 / 60)
+        assert cam.eye is eye
+        assert cam.target is target
+        assert cam.focus_target is focus
+
+    def test_target_converges_to_focus(self):
+        cam = CinematicCamera((0.0, 2.5, 0.0))
+        cam.focus_on((1.0, 2.5, -1.0))
+        for _ in range(240):
+            cam.update(1 / 60)
+        np.testing.assert_allclose(cam.target, [1.0, 2.5, -1.0], atol=1e-4)
+
+    def test_velocity_matches_eye_displacement(self):
+        cam = CinematicCamera((0.0, 2.5, 0.0))
+        cam.set_turn_view(False)
+        before = cam.eye.copy()
+        cam.update(0.02)
+        expected = float(np.linalg.norm(cam.eye - before)) / 0.02
+        assert abs(cam.velocity - expected) < 1e-3
+        assert cam.velocity > 0.0
+
+    def test_settled_camera_is_still(self):
+        cam = CinematicCamera((0.0, 2.5, 0.0))
+        cam.set_turn_view(True)
+        for _ in range(600):
+            cam.update(1 / 60)
+        assert cam.velocity < 1e-2
+
+
+class TestCameraState:
+    def test_state_is_view_of_pose(self):
+        cam = CinematicCamera((0.0, 2.5, 0.0))
+        cam.target_state.yaw = 0.0
+        assert cam.target_state.yaw == 0.0
+        assert cam._pose_goal[0] == 0.0
+        assert isinstance(cam.state.distance, float)
+
+    def test_state_has_no_instance_dict(self):
+        cam = CinematicCamera((0.0, 2.5, 0.0))
+        assert not hasattr(cam.state, "__dict__")
+
+    def test_turn_view_converges(self):
+        cam = CinematicCamera((0.0, 2.5, 0.0))
+        cam.set_turn_view(False)
+        for _ in range(600):
+            cam.update(1 / 60)
+        assert abs(cam.state.yaw - 0.0) < 1e-2
+        assert abs(cam.state.pitch - 32.0) < 1e-2
+        assert abs(cam.state.distance - 15.4) < 1e-2
+
+    def test_eye_follows_orbit_pose(self):
+        cam = CinematicCamera((0.0, 2.5, 0.0))
+        cam.set_turn_view(True)
+        for _ in range(5):
+            cam.update(1 / 60)
+        yaw = math.radians(cam.state.yaw)
+        pitch = math.radians(cam.state.pitch)
+        horizontal = cam.state.distance * math.cos(pitch)
+        expected = [
+            cam.target[0] + horizontal * math.sin(yaw),
+            cam.target[1] + cam.state.distance * math.sin(pitch),
+            cam.target[2] + horizontal * math.cos(yaw),
+        ]
+        np.testing.assert_allclose(cam.eye, expected, atol=1e-4)
+
+
+class TestCameraMatrices:
+    def test_view_matches_pyrr_look_at(self):
+        cam = CinematicCamera((0.3, 2.5, -1.2))
+        cam.set_turn_view(False)
+        for _ in range(20):
+            cam.update(1 / 60)
+        expected = np.asarray(Matrix44.look_at(cam.eye, cam.target, Vector3([0.0, 1.0, 0.0]), dtype="f4"))
+        np.testing.assert_allclose(cam.view_matrix(), expected, atol=1e-5)
+
+    def test_view_matrix_reuses_buffer(self):
+        cam = CinematicCamera((0.0, 2.5, 0.0))
+        assert cam.view_matrix() is cam.view_matrix()
+        assert cam.view_matrix().dtype == np.float32
+
+    def test_revision_tracks_movement(self):
+        cam = CinematicCamera((0.0, 2.5, 0.0))
+        cam.set_turn_view(True)
+        for _ in range(2000):
+            cam.update(1 / 60)
+        settled = cam.revision
+        view = cam.view_matrix().copy()
+        cam.update(1 / 60)
+        assert cam.revision == settled
+        cam.focus_on((1.0, 2.5, -1.0))
+        cam.update(1 / 60)
+        assert cam.revision == settled + 1
+        assert not np.array_equal(cam.view_matrix(), view)
+
+    def test_projection_matches_pyrr(self):
+        cam = CinematicCamera((0.0, 2.5, 0.0))
+        expected = np.asarray(Matrix44.perspective_projection(50.0, 1.6, 0.1, 280.0, dtype="f4"))
+        np.testing.assert_allclose(cam.projection_matrix(1.6), expected, rtol=1e-6)
+
+    def test_projection_is_cached_and_read_only(self):
+        cam = CinematicCamera((0.0, 2.5, 0.0))
+        proj = cam.projection_matrix(1.6)
+        assert proj is cam.projection_matrix(1.6)
+        assert not proj.flags.writeable
@@ -39,6 +39,11 @@ class TestSelection:
         assert gs.selected_square == chess.E2
         assert gs.legal_targets  # pawn on e2 has legal moves
 
+    def test_targets_are_only_from_selected_square(self):
+        gs = ChessGameState()
+        gs.click_square(chess.G1)  # white knight
+        assert gs.legal_targets == {chess.F3, chess.H3}
+
     def test_select_opponent_piece_does_nothing(self):
         gs = ChessGameState()
         update = gs.click_square(chess.E7)  # black pawn
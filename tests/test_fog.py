@@ -0,0 +1,24 @@
+"""Tests for engine.fog — fog uniform uploads."""
+
+from __future__ import annotations
+
+from engine.fog import _FOG_UNIFORMS, FogSettings
+from tests.fakes import FakeProgram
+
+
+class TestFogUpload:
+    def test_unchanged_settings_skip_writes(self):
+        fog = FogSettings()
+        program = FakeProgram(_FOG_UNIFORMS)
+        fog.upload(program)
+        fog.upload(program)
+        assert program.uniforms["uFogDensity"].writes == 1
+
+    def test_changed_settings_are_written(self):
+        fog = FogSettings()
+        program = FakeProgram(_FOG_UNIFORMS)
+        fog.upload(program)
+        fog.density = 0.08
+        fog.upload(program)
+        assert program.uniforms["uFogDensity"].value == 0.08
+        assert program.uniforms["uFogDensity"].writes == 2
@@ -0,0 +1,78 @@
+"""Tests for engine.lighting — light defaults and uniform-buffer packing."""
+
+from __future__ import annotations
+
+import numpy as np
+
+from engine.lighting import _SCALAR_UNIFORMS, POINT_LIGHT_FLOATS, SPOT_LIGHT_FLOATS, SceneLighting
+from tests.fakes import FakeProgram
+
+
+class TestLightPacking:
+    def test_packed_size_matches_std140_block(self):
+        lighting = SceneLighting.cyberpunk_defaults(2.4)
+        data = lighting._pack_lights(8, 2, 3, 1)
+        assert data.dtype == np.float32
+        assert data.nbytes == (8 * 32) + (2 * 48)
+
+    def test_point_light_rows(self):
+        lighting = SceneLighting.cyberpunk_defaults(2.4)
+        data = lighting._pack_lights(8, 2, 3, 1)
+        points = data[: 8 * POINT_LIGHT_FLOATS].reshape(8, POINT_LIGHT_FLOATS)
+        light = lighting.point_lights[1]
+        np.testing.assert_allclose(points[1, 0:3], light.position)
+        assert points[1, 3] == np.float32(light.intensity)
+        np.testing.assert_allclose(points[1, 4:7], light.color)
+        assert points[1, 7] == np.float32(light.light_range)
+        # Slots past the active count stay dark.
+        assert not points[3:].any()
+
+    def test_spot_light_rows(self):
+        lighting = SceneLighting.cyberpunk_defaults(2.4)
+        data = lighting._pack_lights(8, 2, 3, 1)
+        spots = data[8 * POINT_LIGHT_FLOATS :].reshape(2, SPOT_LIGHT_FLOATS)
+        light = lighting.spot_lights[0]
+        np.testing.assert_allclose(spots[0, 0:3], light.position)
+        np.testing.assert_allclose(spots[0, 4:7], light.direction)
+        assert spots[0, 7] == np.float32(light.cutoff_cos)
+        np.testing.assert_allclose(spots[0, 8:11], light.color)
+        assert not spots[1].any()
+
+    def test_turn_bias_is_repacked(self):
+        lighting = SceneLighting.cyberpunk_defaults(2.4)
+        lighting._pack_lights(8, 2, 3, 1)
+        lighting.apply_turn_bias(False, 2.4)
+        data = lighting._pack_lights(8, 2, 3, 1)
+        assert data[2] == np.float32(5.8)
+
+
+def _scalar_program() -> FakeProgram:
+    # No LightBlock, so upload stops after the scalar uniforms.
+    return FakeProgram(_SCALAR_UNIFORMS)
+
+
+class TestUploadGuard:
+    def test_unchanged_lights_skip_upload(self):
+        lighting = SceneLighting.cyberpunk_defaults(2.4)
+        program = _scalar_program()
+        lighting.upload(program, 8, 2)
+        writes = program.writes
+        lighting.upload(program, 8, 2)
+        assert program.writes == writes
+
+    def test_turn_bias_forces_upload(self):
+        lighting = SceneLighting.cyberpunk_defaults(2.4)
+        program = _scalar_program()
+        lighting.upload(program, 8, 2)
+        writes = program.writes
+        lighting.apply_turn_bias(False, 2.4)
+        lighting.upload(program, 8, 2)
+        assert program.writes > writes
+
+    def test_changed_field_is_uploaded(self):
+        lighting = SceneLighting.cyberpunk_defaults(2.4)
+        program = _scalar_program()
+        lighting.upload(program, 8, 2)
+        lighting.directional.direction = (0.0, -1.0, 0.0)
+        lighting.upload(program, 8, 2)
+        assert program["uDirLight.direction"].value == (0.0, -1.0, 0.0)
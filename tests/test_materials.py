@@ -0,0 +1,67 @@
+"""Tests for engine.materials — std140 material packing and the material palette."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from engine.materials import MATERIAL_STRIDE, MAX_MATERIALS, CyberpunkMaterials, MaterialDef, MaterialPalette
+
+# Decodes packed material bytes field by field, following pbr.vert's std140 Material.
+MATERIAL_DTYPE = np.dtype(
+    {
+        "names": ["albedo", "metallic", "roughness", "specular", "emissive"],
+        "formats": [("f4", 3), "f4", "f4", "f4", ("f4", 3)],
+        "offsets": [0, 12, 16, 20, 32],
+        "itemsize": 48,
+    }
+)
+
+
+class TestMaterialPacking:
+    def test_stride_matches_std140_struct(self):
+        assert MATERIAL_STRIDE == MATERIAL_DTYPE.itemsize == 48
+        assert len(CyberpunkMaterials.BOARD_LIGHT.packed) == MATERIAL_STRIDE
+
+    def test_packed_round_trips(self):
+        mat = CyberpunkMaterials.CITY_NEON_PINK
+        row = np.frombuffer(mat.packed, dtype=MATERIAL_DTYPE)[0]
+        np.testing.assert_allclose(row["albedo"], mat.albedo)
+        assert row["metallic"] == np.float32(mat.metallic)
+        assert row["roughness"] == np.float32(mat.roughness)
+        assert row["specular"] == np.float32(mat.specular)
+        np.testing.assert_allclose(row["emissive"], mat.emissive)
+
+    def test_packed_is_cached_per_instance(self):
+        mat = MaterialDef((0.1, 0.2, 0.3), 0.4, 0.5, 0.6, (0.7, 0.8, 0.9))
+        assert mat.packed is mat.packed
+        assert mat == MaterialDef((0.1, 0.2, 0.3), 0.4, 0.5, 0.6, (0.7, 0.8, 0.9))
+
+
+class TestMaterialPalette:
+    def test_slots_are_stable_and_dense(self):
+        palette = MaterialPalette([CyberpunkMaterials.BOARD_LIGHT, CyberpunkMaterials.BOARD_DARK])
+        assert palette.slot(CyberpunkMaterials.BOARD_DARK) == 1
+        assert palette.slot(CyberpunkMaterials.RAIN_STREAK) == 2
+        assert palette.slot(CyberpunkMaterials.RAIN_STREAK) == 2
+        assert len(palette) == 3
+
+    def test_new_material_bumps_revision(self):
+        palette = MaterialPalette([CyberpunkMaterials.BOARD_LIGHT])
+        revision = palette.revision
+        palette.slot(CyberpunkMaterials.BOARD_LIGHT)
+        assert palette.revision == revision
+        palette.slot(CyberpunkMaterials.LEGAL_MARKER)
+        assert palette.revision == revision + 1
+
+    def test_packed_is_std140_array(self):
+        palette = MaterialPalette([CyberpunkMaterials.BOARD_LIGHT, CyberpunkMaterials.CITY_NEON_PINK])
+        rows = np.frombuffer(palette.packed(), dtype=MATERIAL_DTYPE)
+        np.testing.assert_allclose(rows[1]["emissive"], CyberpunkMaterials.CITY_NEON_PINK.emissive)
+
+    def test_overflow_raises(self):
+        palette = MaterialPalette()
+        for i in range(MAX_MATERIALS):
+            palette.slot(MaterialDef((0.0, 0.0, 0.0), 0.0, 0.0, 0.0, (float(i), 0.0, 0.0)))
+        with pytest.raises(ValueError):
+            palette.slot(MaterialDef((1.0, 1.0, 1.0), 0.0, 0.0, 0.0, (0.0, 0.0, 0.0)))
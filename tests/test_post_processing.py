@@ -0,0 +1,23 @@
+"""Tests for engine.post_processing — CPU-side shader helpers."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from engine.post_processing import _specialize
+
+_SHADER_DIR = Path(__file__).resolve().parents[1] / "engine" / "shaders"
+
+
+class TestSpecialize:
+    def test_rewrites_only_the_named_define(self):
+        source = (_SHADER_DIR / "final_composite.frag").read_text(encoding="utf-8")
+        result = _specialize(source, "SRGB_OUTPUT", 1)
+        assert result.count("#define SRGB_OUTPUT 1\n") == 1
+        # Everything else, including the #if that reads the define, is untouched.
+        assert result.replace("#define SRGB_OUTPUT 1\n", "#define SRGB_OUTPUT 0\n") == source
+
+    def test_composite_default_is_rewritable(self):
+        source = (_SHADER_DIR / "final_composite.frag").read_text(encoding="utf-8")
+        assert "#define SRGB_OUTPUT 0" in source
+        assert "#define SRGB_OUTPUT 1" in _specialize(source, "SRGB_OUTPUT", 1)
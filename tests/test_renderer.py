@@ -0,0 +1,128 @@
+"""Tests for engine.renderer — CPU-side helpers that need no GL context."""
+
+from __future__ import annotations
+
+import math
+
+import numpy as np
+import pytest
+from pyrr import Matrix44, Vector3
+
+from engine.renderer import (
+    _CUBE_VERTICES,
+    VERTEX_DTYPE,
+    _cone_geometry,
+    _cube_geometry,
+    _cylinder_geometry,
+    _model_matrices,
+    _model_matrix,
+    _pack_vertices,
+)
+
+# The hand-written cube literal that _cube_geometry replaced, one row per vertex.
+_LITERAL_CUBE_VERTICES = np.array(
+    [
+        (-0.5, -0.5, 0.5, 0.0, 0.0, 1.0, 0.0, 0.0),  # +Z
+        (0.5, -0.5, 0.5, 0.0, 0.0, 1.0, 1.0, 0.0),
+        (0.5, 0.5, 0.5, 0.0, 0.0, 1.0, 1.0, 1.0),
+        (-0.5, 0.5, 0.5, 0.0, 0.0, 1.0, 0.0, 1.0),
+        (0.5, -0.5, -0.5, 0.0, 0.0, -1.0, 0.0, 0.0),  # -Z
+        (-0.5, -0.5, -0.5, 0.0, 0.0, -1.0, 1.0, 0.0),
+        (-0.5, 0.5, -0.5, 0.0, 0.0, -1.0, 1.0, 1.0),
+        (0.5, 0.5, -0.5, 0.0, 0.0, -1.0, 0.0, 1.0),
+        (0.5, -0.5, 0.5, 1.0, 0.0, 0.0, 0.0, 0.0),  # +X
+        (0.5, -0.5, -0.5, 1.0, 0.0, 0.0, 1.0, 0.0),
+        (0.5, 0.5, -0.5, 1.0, 0.0, 0.0, 1.0, 1.0),
+        (0.5, 0.5, 0.5, 1.0, 0.0, 0.0, 0.0, 1.0),
+        (-0.5, -0.5, -0.5, -1.0, 0.0, 0.0, 0.0, 0.0),  # -X
+        (-0.5, -0.5, 0.5, -1.0, 0.0, 0.0, 1.0, 0.0),
+        (-0.5, 0.5, 0.5, -1.0, 0.0, 0.0, 1.0, 1.0),
+        (-0.5, 0.5, -0.5, -1.0, 0.0, 0.0, 0.0, 1.0),
+        (-0.5, 0.5, 0.5, 0.0, 1.0, 0.0, 0.0, 0.0),  # +Y
+        (0.5, 0.5, 0.5, 0.0, 1.0, 0.0, 1.0, 0.0),
+        (0.5, 0.5, -0.5, 0.0, 1.0, 0.0, 1.0, 1.0),
+        (-0.5, 0.5, -0.5, 0.0, 1.0, 0.0, 0.0, 1.0),
+        (-0.5, -0.5, -0.5, 0.0, -1.0, 0.0, 0.0, 0.0),  # -Y
+        (0.5, -0.5, -0.5, 0.0, -1.0, 0.0, 1.0, 0.0),
+        (0.5, -0.5, 0.5, 0.0, -1.0, 0.0, 1.0, 1.0),
+        (-0.5, -0.5, 0.5, 0.0, -1.0, 0.0, 0.0, 1.0),
+    ],
+    dtype="f4",
+).ravel()
+_LITERAL_CUBE_INDICES = np.array(
+    [
+        (0, 1, 2, 0, 2, 3),
+        (4, 5, 6, 4, 6, 7),
+        (8, 9, 10, 8, 10, 11),
+        (12, 13, 14, 12, 14, 15),
+        (16, 17, 18, 16, 18, 19),
+        (20, 21, 22, 20, 22, 23),
+    ],
+    dtype="i4",
+).ravel()
+
+
+def _pyrr_model_matrix(position, scale, yaw_degrees):
+    translation = Matrix44.from_translation(Vector3(position), dtype="f4")
+    rotation = Matrix44.from_y_rotation(math.radians(yaw_degrees), dtype="f4")
+    scale_m = Matrix44.from_scale(Vector3(scale), dtype="f4")
+    return np.array(translation * rotation * scale_m, dtype="f4")
+
+
+class TestModelMatrix:
+    @pytest.mark.parametrize("yaw", [0.0, 37.0, 90.0, -215.0])
+    def test_matches_pyrr_composition(self, yaw):
+        position, scale = (1.5, -2.0, 3.25), (0.4, 2.0, 1.3)
+        np.testing.assert_allclose(
+            _model_matrix(position, scale, yaw), _pyrr_model_matrix(position, scale, yaw), atol=1e-6
+        )
+
+    def test_dtype_and_shape(self):
+        matrix = _model_matrix((0.0, 0.0, 0.0))
+        assert matrix.dtype == np.float32
+        assert matrix.shape == (4, 4)
+
+    def test_batch_matches_single(self):
+        positions = np.array([(1.5, -2.0, 3.25), (0.0, 0.5, -1.0), (-4.0, 2.0, 0.25)])
+        scales = [(0.4, 2.0, 1.3), (1.0, 1.0, 1.0), (0.1, 0.3, 0.2)]
+        yaws = np.array([37.0, 0.0, -215.0])
+        batch = _model_matrices(positions, scales, yaws)
+        assert batch.dtype == np.float32
+        for i in range(3):
+            np.testing.assert_array_equal(batch[i], _model_matrix(tuple(positions[i]), scales[i], yaws[i]))
+
+
+class TestMeshGeometry:
+    @pytest.mark.parametrize("build", [_cube_geometry, lambda: _cylinder_geometry(24), lambda: _cone_geometry(24)])
+    def test_layout_and_unit_normals(self, build):
+        vertices, indices = build()
+        assert vertices.dtype == np.float32
+        assert indices.dtype == np.int32
+        rows = vertices.reshape(-1, 8)
+        assert indices.min() == 0
+        assert indices.max() == len(rows) - 1
+        assert len(indices) % 3 == 0
+        np.testing.assert_allclose(np.linalg.norm(rows[:, 3:6], axis=1), 1.0, atol=1e-5)
+
+    def test_cylinder_vertex_counts(self):
+        vertices, indices = _cylinder_geometry(24)
+        # Side rings share a seam column; each cap adds a center vertex.
+        assert len(vertices) // 8 == 2 * 25 + 2 * 25
+        assert len(indices) == 24 * 6 + 2 * 24 * 3
+
+    def test_packed_vertices_round_trip(self):
+        for vertices in (_CUBE_VERTICES, _cylinder_geometry(24)[0]):
+            rows = vertices.reshape(-1, 8)
+            packed = _pack_vertices(vertices)
+            assert packed.dtype == VERTEX_DTYPE
+            assert VERTEX_DTYPE.itemsize == 24
+            np.testing.assert_array_equal(packed["position"], rows[:, 0:3])
+            np.testing.assert_allclose(packed["normal"], rows[:, 3:6], atol=1e-3)
+            np.testing.assert_array_equal(packed["uv"], rows[:, 6:8].astype("f2"))
+        # Axis-aligned cube normals survive half precision exactly.
+        np.testing.assert_array_equal(_pack_vertices(_CUBE_VERTICES)["normal"], _CUBE_VERTICES.reshape(-1, 8)[:, 3:6])
+
+    def test_cube_matches_literal(self):
+        vertices, indices = _cube_geometry()
+        assert vertices.tobytes() == _LITERAL_CUBE_VERTICES.tobytes()
+        assert indices.tobytes() == _LITERAL_CUBE_INDICES.tobytes()
@@ -6,8 +6,28 @@ from pathlib import Path
 
 import numpy as np
 import pytest
+from pyrr import Matrix44
 
-from engine.utils import normalize, normalize_safe, read_shader
+from engine.utils import (
+    boxes_in_frustum,
+    clamp,
+    frustum_planes,
+    look_at,
+    normalize,
+    normalize_safe,
+    orthographic,
+    perspective,
+    read_shader,
+)
+
+
+class TestClamp:
+    def test_inside_range_unchanged(self):
+        assert clamp(0.5, 0.25, 0.85) == 0.5
+
+    def test_clamps_both_ends(self):
+        assert clamp(-1.0, 0.25, 0.85) == 0.25
+        assert clamp(2.0, 0.25, 0.85) == 0.85
 
 
 class TestNormalize:
@@ -51,6 +71,41 @@ class TestNormalizeSafe:
         np.testing.assert_array_equal(result, v)
 
 
+class TestMatrixBuilders:
+    def test_orthographic_matches_pyrr(self):
+        expected = np.asarray(Matrix44.orthogonal_projection(-20.0, 20.0, -10.0, 10.0, 0.5, 90.0, dtype="f4"))
+        result = orthographic(-20.0, 20.0, -10.0, 10.0, 0.5, 90.0, np.empty((4, 4), dtype="f4"))
+        np.testing.assert_allclose(result, expected, rtol=1e-6)
+
+
+class TestFrustumCulling:
+    @staticmethod
+    def _planes():
+        view = look_at(np.zeros(3, dtype="f4"), np.array([0.0, 0.0, -1.0]), (0.0, 1.0, 0.0), np.empty((4, 4), "f4"))
+        projection = perspective(60.0, 1.0, 0.1, 100.0, np.empty((4, 4), "f4"))
+        return frustum_planes(view @ projection)
+
+    def test_planes_are_normalized(self):
+        np.testing.assert_allclose(np.linalg.norm(self._planes()[:, :3], axis=1), 1.0, atol=1e-5)
+
+    def test_box_mask(self):
+        centers = np.array(
+            [
+                [0.0, 0.0, -10.0],  # straight ahead
+                [0.0, 0.0, 10.0],  # behind the camera
+                [0.0, 0.0, -200.0],  # past the far plane
+                [8.0, 0.0, -10.0],  # outside the right plane, but wide enough to cross it
+                [7.0, 0.0, -10.0],  # same distance out, but too thin to reach in
+            ],
+            dtype="f4",
+        )
+        half_axes = np.repeat(np.eye(3, dtype="f4")[None] * 0.5, len(centers), axis=0)
+        half_axes[3, 0, 0] = 3.0
+        half_axes[4, 1, 1] = 30.0  # tall, which a bounding sphere would wrongly keep
+        mask = boxes_in_frustum(self._planes(), centers, half_axes)
+        assert mask.tolist() == [True, False, False, True, False]
+
+
 class TestReadShader:
     def test_reads_file_content(self, tmp_path: Path):
         shader_path = tmp_path / "shader.glsl"